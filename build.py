@@ -18,8 +18,23 @@ options = [
     '--noconfirm', # 기존 배포 폴더 삭제 시 확인 안 함
     '--clean',   # 캐시 정리
     '--icon=icon.ico', # 아이콘 추가
+    '--optimize=1',    # assert 제거된 최적화 바이트코드로 수집 (docstring은 서드파티 호환을 위해 유지)
 ]
 
+# 개발/디버그용 스크립트는 번들에서 제외
+dev_scripts = [
+    'debug_lyrics',
+    'debug_windows',
+    'create_icon',
+    'update_font',
+    'test_current_media',
+    'test_lyrics',
+    'test_parsing',
+    'test_timeline',
+]
+for module in dev_scripts:
+    options.append(f'--exclude-module={module}')
+
 # 수집된 데이터 파일을 옵션에 추가 (--add-data "src;dest")
 for source, dest in datas:
     options.append(f'--add-data={source}{os.pathsep}{dest}')
@@ -5,21 +5,31 @@ print("=" * 60)
 print("브라우저 창 제목 디버깅")
 print("=" * 60)
 
-def enum_callback(hwnd, results):
-    if not win32gui.IsWindowVisible(hwnd):
-        return True
-    
-    class_name = win32gui.GetClassName(hwnd)
-    title = win32gui.GetWindowText(hwnd)
-    
-    # 브라우저 창만 필터링
-    if class_name in ["Chrome_WidgetWin_1", "MozillaWindowClass"] and title:
-        results.append((class_name, title))
-    
-    return True
+BROWSER_CLASSES = ["Chrome_WidgetWin_1", "MozillaWindowClass"]
+
+def find_windows_by_class(class_name):
+    """해당 클래스의 최상위 창만 순회 (EnumWindows로 모든 창의 클래스명을 조회하지 않음)"""
+    hwnds = []
+    hwnd = 0
+    while True:
+        try:
+            hwnd = win32gui.FindWindowEx(0, hwnd, class_name, None)
+        except win32gui.error:
+            break
+        if not hwnd:
+            break
+        hwnds.append(hwnd)
+    return hwnds
 
 windows = []
-win32gui.EnumWindows(enum_callback, windows)
+for class_name in BROWSER_CLASSES:
+    for hwnd in find_windows_by_class(class_name):
+        if not win32gui.IsWindowVisible(hwnd):
+            continue
+        
+        title = win32gui.GetWindowText(hwnd)
+        if title:
+            windows.append((class_name, title))
 
 print(f"\n찾은 브라우저 창 ({len(windows)}개):\n")
 for class_name, title in windows:
@@ -1,79 +1,200 @@
 """
 가사를 검색하고 가져오는 모듈.
 syncedlyrics 라이브러리를 사용하여 시간 동기화된 LRC 가사를 검색합니다.
-파일 기반 캐싱을 지원하여 반복 검색 속도를 획기적으로 개선합니다.
+SQLite 파일 기반 캐싱을 지원하여 반복 검색 속도를 획기적으로 개선합니다.
 """
 
+import atexit
+import functools
 import re
 import json
 import os
+import sqlite3
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, as_completed, wait
 from typing import Optional
-import syncedlyrics
 
 class LyricsFetcher:
     """가사 검색 및 가져오기 (파일 캐싱 지원)"""
     
-    CACHE_FILE = "lyrics_cache.json"
+    CACHE_FILE = "lyrics_cache.db"
+    LEGACY_CACHE_FILE = "lyrics_cache.json"  # 이전 버전 캐시 (최초 실행 시 DB로 이전)
     
     # 검색 시도 횟수 제한 (신뢰성을 위해 적절히 증가)
     MAX_SEARCH_ATTEMPTS = 4
     
+    # 검색 프로바이더 목록 (우선순위 순, 빠르고 무료인 lrclib 우선)
+    PROVIDERS = ['lrclib', 'musixmatch', 'netease']                       # 자동 검색용
+    CANDIDATE_PROVIDERS = ['lrclib', 'musixmatch', 'netease', 'megalobiz']  # 수동 후보 검색용
+    
+    # 후보 검색 시 프로바이더 하나를 기다리는 최대 시간 (초)
+    CANDIDATE_TIMEOUT = 10.0
+    
+    # 공용 검색 스레드 풀 크기 (get_lyrics 작업 수 + 후보 검색 여유분)
+    SEARCH_WORKERS = 16
+    
+    # 1순위가 아닌 유효 결과를 확보한 뒤 더 높은 우선순위 결과를 기다리는 시간 (초)
+    PRIORITY_WAIT = 3.0
+    
+    # 캐시 변경 후 DB에 모아서 기록하기까지의 지연 시간 (초)
+    CACHE_FLUSH_DELAY = 5.0
+    
+    # 검색 실패한 곡을 다시 검색하지 않고 건너뛰는 기간 (초)
+    # syncedlyrics는 네트워크 오류도 '못 찾음'(None)으로 반환해 구분할 수 없으므로 짧게 두고 메모리에만 기록
+    NEGATIVE_CACHE_TTL = 10 * 60
+    
+    # 같은 곡을 검색 중인 다른 스레드의 결과를 기다리는 최대 시간 (초)
+    INFLIGHT_WAIT = 10.0
+    
+    # 프로바이더별 검색 결과를 메모리에 재사용하는 기간 (초)과 최대 항목 수
+    SEARCH_MEMO_TTL = 60 * 60
+    SEARCH_MEMO_SIZE = 512
+    
+    # 길이 검증 시 마지막 타임스탬프를 찾기 위해 먼저 살펴볼 끝부분 길이 (문자 수)
+    VALIDATE_TAIL_CHARS = 256
+    
+    # 검색어 생성/정제용 정규식 (호출마다 컴파일하지 않도록 미리 컴파일)
+    LRC_TIMESTAMP_PATTERN = re.compile(r'\[(\d+):(\d+(?:\.\d+)?)\]')       # [mm:ss.xx]
+    COVER_PART_PATTERN = re.compile(r'(cover|by\s|performed by)', re.IGNORECASE)
+    COVER_TITLE_PATTERN = re.compile(r'(cover|커버|歌ってみた|カバー)', re.IGNORECASE)
+    BRACKET_CONTENT_PATTERN = re.compile(r'[\[\(\{]([^\]\)\}]+)[\]\)\}]')  # 괄호 안 내용 추출
+    BRACKET_PATTERN = re.compile(r'[\[\(\{].*?[\]\)\}]')                  # 괄호 전체 제거
+    # 괄호 종류별 제거 (순서대로 적용해야 '(a [b) c]'처럼 엇갈린 괄호도 이전과 같은 결과)
+    # (여는 괄호, 패턴) - 여는 괄호가 없는 종류는 정규식 생략
+    CLEAN_BRACKET_PATTERNS = [
+        ('[', re.compile(r'\[.*?\]')),
+        ('(', re.compile(r'\(.*?\)')),
+        ('{', re.compile(r'\{.*?\}')),
+        ('【', re.compile(r'【.*?】')),
+        ('「', re.compile(r'「.*?」')),
+    ]
+    SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s\-\']')  # 알파벳, 숫자, 공백, 하이픈, 따옴표 외
+    # ASCII 문자열용 특수문자 치환 테이블 (SPECIAL_CHAR_PATTERN과 동일한 결과, 정규식 엔진 생략)
+    SPECIAL_CHAR_TABLE = dict.fromkeys(map(ord, SPECIAL_CHAR_PATTERN.findall(''.join(map(chr, range(128))))), ' ')
+    
+    # 제거할 노이즈 키워드 (키워드마다 re.sub 하지 않고 하나의 패턴으로 한 번에 제거)
+    NOISE_KEYWORDS = ['official video', 'official audio', 'mv', 'm/v', 'flac', 'hq', 'lyrics', 'lyric video']
+    NOISE_KEYWORD_PATTERN = re.compile('|'.join(re.escape(kw) for kw in NOISE_KEYWORDS), re.IGNORECASE)
+    CLEAN_KEYWORDS = ['official video', 'mv', 'm/v', 'lyric video', 'lyrics', 'feat.', 'prod.', 'cover']
+    CLEAN_KEYWORD_PATTERN = re.compile('|'.join(re.escape(kw) for kw in CLEAN_KEYWORDS), re.IGNORECASE)
+    
     def __init__(self):
-        self._cache = {}
+        self._cache: dict[tuple[str, str], Optional[str]] = {}  # (제목, 아티스트) -> 가사
+        self._misses: dict[tuple[str, str], float] = {}  # 검색 실패한 캐시 키 -> 실패 시각 (DB에 저장하지 않음)
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()  # 검색 스레드 간 DB 쓰기 보호
+        self._pending_writes: dict[tuple[str, str], Optional[str]] = {}  # 아직 DB에 기록되지 않은 항목
+        self._flush_timer: Optional[threading.Timer] = None
+        self._last_validated: Optional[tuple[tuple[str, str], int]] = None  # 마지막으로 검증 통과한 (캐시 키, 곡 길이)
+        # 검색마다 스레드를 새로 만들지 않도록 공용 스레드 풀 사용
+        self._executor = ThreadPoolExecutor(max_workers=self.SEARCH_WORKERS, thread_name_prefix='lrc')
+        # (정규화된 쿼리, 프로바이더) -> (검색 시각, 가사): 같은 검색을 반복해서 보내지 않도록
+        self._search_memo: dict[tuple[str, str], tuple[float, str]] = {}
+        self._search_memo_lock = threading.Lock()
+        # 검색 중인 캐시 키 -> 완료 이벤트 (같은 곡 중복 검색 방지)
+        self._inflight: dict[tuple[str, str], threading.Event] = {}
+        self._inflight_lock = threading.Lock()
         self._load_cache()
+        atexit.register(self.close)
+        
+        # 첫 검색이 import 비용을 떠안지 않도록 백그라운드에서 미리 로드
+        threading.Thread(target=self._preload_search_modules, daemon=True).start()
+    
+    def _preload_search_modules(self):
+        """syncedlyrics 및 프로바이더 모듈 미리 로드"""
+        try:
+            import syncedlyrics  # noqa: F401
+        except Exception as e:
+            print(f"[가사] syncedlyrics 미리 로드 실패: {e}")
+    
+    def _search_provider(self, query: str, provider: str) -> Optional[str]:
+        """단일 프로바이더 검색 (최근에 찾은 결과는 네트워크 요청 없이 재사용)"""
+        import syncedlyrics  # 프로바이더 의존성이 무거우므로 처음 검색할 때 로드
+        
+        memo_key = (query.casefold().strip(), provider)
+        now = time.time()
+        with self._search_memo_lock:
+            entry = self._search_memo.get(memo_key)
+        if entry and now - entry[0] < self.SEARCH_MEMO_TTL:
+            return entry[1]
+        
+        lrc = syncedlyrics.search(query, providers=[provider])
+        
+        # 찾은 결과만 기억 (못 찾은 경우는 수동 재검색을 막지 않도록 저장하지 않음)
+        if lrc:
+            with self._search_memo_lock:
+                if len(self._search_memo) >= self.SEARCH_MEMO_SIZE:
+                    self._search_memo = {k: v for k, v in self._search_memo.items()
+                                         if now - v[0] < self.SEARCH_MEMO_TTL}
+                    if len(self._search_memo) >= self.SEARCH_MEMO_SIZE:
+                        self._search_memo.pop(next(iter(self._search_memo)))  # 가장 오래된 항목 제거
+                self._search_memo[memo_key] = (now, lrc)
+        return lrc
 
     # ... (생략된 메서드들) ...
 
-    def search_candidates(self, query: str, return_first: bool = False) -> list[tuple[str, str]]:
+    def search_candidates(self, *queries: str, return_first: bool = False) -> list[tuple[str, str]]:
         """
-        주어진 쿼리로 여러 소스에서 가사 후보 검색 (병렬)
+        주어진 쿼리(들)로 여러 소스에서 가사 후보 검색 (병렬)
         
         Args:
-            query: 검색 쿼리
+            queries: 검색 쿼리 (여러 개면 쿼리 x 프로바이더 조합을 한 번에 병렬 실행)
             return_first: True면 첫 결과 찾으면 즉시 반환 (더 빠름)
         
         Returns:
-            [(ProviderName, LyricsSnippet), ...]
+            [(ProviderName, LyricsSnippet), ...] (같은 프로바이더의 같은 가사는 한 번만)
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
         results = []
-        # 검색할 프로바이더 목록
-        providers = [
-            'musixmatch', 
-            'netease', 
-            'lrclib', 
-            'megalobiz'
-        ]
-        
-        print(f"[검색] 쿼리: {query} (병렬 검색)")
+        seen = set()
         
-        def search_provider(prov):
+        # (쿼리, 프로바이더) 조합 생성 (정규화 후 같은 검색은 한 번만)
+        search_tasks = []
+        submitted = set()
+        for query in queries:
+            for prov in self.CANDIDATE_PROVIDERS:
+                pair = (query.casefold().strip(), prov)
+                if pair in submitted:
+                    continue
+                submitted.add(pair)
+                search_tasks.append((query, prov))
+        
+        print(f"[검색] 쿼리: {' / '.join(queries)} (병렬 검색 {len(search_tasks)}건)")
+        
+        def search_provider(task):
             """개별 프로바이더 검색"""
+            query, prov = task
             try:
-                lrc = syncedlyrics.search(query, providers=[prov])
+                lrc = self._search_provider(query, prov)
                 if lrc:
                     return (prov, lrc)
             except Exception as e:
                 print(f"[검색] 오류 ({prov}): {e}")
             return None
         
-        # 병렬 검색 (최대 4개 동시 실행)
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(search_provider, prov): prov for prov in providers}
-            
-            for future in as_completed(futures):
+        # 병렬 검색 (공용 스레드 풀에서 쿼리 x 프로바이더별로 동시 실행)
+        futures = {self._executor.submit(search_provider, task): task[1] for task in search_tasks}
+        
+        try:
+            # 응답 없는 프로바이더 하나가 전체 검색을 막지 않도록 타임아웃 적용
+            for future in as_completed(futures, timeout=self.CANDIDATE_TIMEOUT):
                 result = future.result()
-                if result:
+                if result and result not in seen:
+                    seen.add(result)
                     prov, lrc = result
                     print(f"[검색] {prov}에서 결과 찾음!")
                     results.append(result)
                     
                     # 첫 결과 즉시 반환 옵션
                     if return_first:
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        return results
+                        break
+        except TimeoutError:
+            pending = [futures[f] for f in futures if not f.done()]
+            print(f"[검색] 시간 초과, 응답 없는 프로바이더 건너뜀: {pending}")
+        finally:
+            # 아직 시작하지 않은 작업만 취소 (공용 풀이므로 종료하지 않음)
+            for future in futures:
+                future.cancel()
         
         return results
 
@@ -87,9 +208,12 @@ class LyricsFetcher:
         cached_lyrics = self._load_from_cache(cache_key)
         
         if cached_lyrics:
-            if self._validate_lyrics(cached_lyrics, duration_ms):
+            if self._is_cache_valid(cache_key, cached_lyrics, duration_ms):
                 print(f"[가사] 캐시 적중: {title} - {artist}")
                 return cached_lyrics
+        elif self._is_recent_miss(cache_key):
+            print(f"[가사] 최근 검색 실패한 곡, 재검색 생략: {title} - {artist}")
+            return None
         
         print(f"[가사] 다중 소스 검색 시작: {title} - {artist}")
         
@@ -118,41 +242,123 @@ class LyricsFetcher:
             return lrc
         
         print("[가사] 다중 소스 검색 실패")
+        self._save_miss(cache_key)
         return None
 
     def _load_cache(self):
-        """캐시 파일 로드"""
-        if os.path.exists(self.CACHE_FILE):
-            try:
-                with open(self.CACHE_FILE, 'r', encoding='utf-8') as f:
-                    self._cache = json.load(f)
-                print(f"[가사] 캐시 로드 완료 ({len(self._cache)}곡)")
-            except Exception as e:
-                print(f"[가사] 캐시 로드 실패: {e}")
-                self._cache = {}
+        """캐시 DB 열기 및 메모리로 로드 (최초 실행 시 JSON 캐시 이전)"""
+        is_new = not os.path.exists(self.CACHE_FILE)
+        try:
+            self._db = sqlite3.connect(self.CACHE_FILE, check_same_thread=False)
+            # WAL + NORMAL: 커밋마다 전체 fsync 하지 않아 저장 비용 감소 (캐시이므로 충분히 안전)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            with self._db:
+                self._db.execute("CREATE TABLE IF NOT EXISTS lyrics (title TEXT, artist TEXT, lrc TEXT, PRIMARY KEY (title, artist))")
+            if is_new:
+                self._migrate_legacy_cache()
+            
+            self._cache = {(title, artist): lrc for title, artist, lrc in
+                           self._db.execute("SELECT title, artist, lrc FROM lyrics")}
+            print(f"[가사] 캐시 로드 완료 ({len(self._cache)}곡)")
+        except Exception as e:
+            print(f"[가사] 캐시 로드 실패: {e}")
+            self._cache = {}
     
-    def _save_cache(self):
-        """캐시 파일 저장"""
+    @staticmethod
+    def _split_legacy_key(key: str) -> tuple[str, str]:
+        """JSON 캐시 키("제목 | 아티스트")를 (제목, 아티스트) 키로 변환"""
+        title, sep, artist = key.rpartition(' | ')
+        if not sep:
+            return (key.casefold(), '')
+        return (title.casefold(), artist.casefold())
+    
+    def _migrate_legacy_cache(self):
+        """이전 버전의 JSON 캐시 파일을 DB로 이전"""
+        if not os.path.exists(self.LEGACY_CACHE_FILE):
+            return
         try:
-            with open(self.CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, ensure_ascii=False, indent=2)
-            print("[가사] 캐시 저장 완료")
+            with open(self.LEGACY_CACHE_FILE, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            with self._db:
+                self._db.executemany("INSERT OR REPLACE INTO lyrics VALUES (?, ?, ?)",
+                                     [(*self._split_legacy_key(key), lrc) for key, lrc in legacy.items()])
+            print(f"[가사] JSON 캐시 이전 완료 ({len(legacy)}곡)")
         except Exception as e:
-            print(f"[가사] 캐시 저장 실패: {e}")
+            print(f"[가사] JSON 캐시 이전 실패: {e}")
+    
+    def _save_cache(self):
+        """대기 중인 캐시 항목을 한 번의 트랜잭션으로 DB에 저장"""
+        with self._db_lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            pending, self._pending_writes = self._pending_writes, {}
+            if not pending or self._db is None:
+                return
+            
+            try:
+                with self._db:
+                    self._db.executemany("INSERT OR REPLACE INTO lyrics VALUES (?, ?, ?)",
+                                         [(*key, lrc) for key, lrc in pending.items()])
+                print(f"[가사] 캐시 저장 완료 ({len(pending)}곡)")
+            except Exception as e:
+                print(f"[가사] 캐시 저장 실패: {e}")
+    
+    def close(self):
+        """대기 중인 캐시를 기록하고 DB 닫기 (종료 시 호출)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._save_cache()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
     # Added helper methods for cache operations
-    def _get_cache_key(self, title: str, artist: str) -> str:
-        """캐시 키 생성"""
-        return f"{title} | {artist}".lower()
+    def _get_cache_key(self, title: str, artist: str) -> tuple[str, str]:
+        """캐시 키 생성 (대소문자 구분 없는 (제목, 아티스트) 튜플 - 구분자 충돌 없음)"""
+        return (title.casefold(), artist.casefold())
 
-    def _load_from_cache(self, cache_key: str) -> Optional[str]:
+    def _load_from_cache(self, cache_key: tuple[str, str]) -> Optional[str]:
         """캐시에서 가사 로드"""
         return self._cache.get(cache_key)
 
-    def _save_to_cache(self, cache_key: str, lyrics: Optional[str]):
-        """가사를 캐시에 저장하고 파일에 덤프"""
+    def _save_to_cache(self, cache_key: tuple[str, str], lyrics: Optional[str]):
+        """가사를 캐시에 저장 (DB 기록은 모아서 지연 처리)"""
+        # 같은 값이면 디스크 I/O 생략 (실패한 곡 재검색 시 반복 기록 방지)
+        if cache_key in self._cache and self._cache[cache_key] == lyrics:
+            return
+        
         self._cache[cache_key] = lyrics
-        self._save_cache()
+        if self._last_validated and self._last_validated[0] == cache_key:
+            self._last_validated = None
+        # 가사를 찾았으면 실패 기록 삭제
+        if lyrics:
+            self._misses.pop(cache_key, None)
+        with self._db_lock:
+            self._pending_writes[cache_key] = lyrics
+            self._schedule_flush()
+    
+    def cache_put(self, title: str, artist: str, lyrics: Optional[str]):
+        """곡의 가사를 캐시에 저장 (수동으로 선택한 가사 등, DB 기록은 지연 처리)"""
+        self._save_to_cache(self._get_cache_key(title, artist), lyrics)
+    
+    def _is_recent_miss(self, cache_key: tuple[str, str]) -> bool:
+        """최근(NEGATIVE_CACHE_TTL 이내)에 검색 실패한 곡인지 확인"""
+        ts = self._misses.get(cache_key)
+        return ts is not None and time.time() - ts < self.NEGATIVE_CACHE_TTL
+    
+    def _save_miss(self, cache_key: tuple[str, str]):
+        """검색 실패 기록 (같은 곡을 곧바로 다시 검색하지 않도록, 메모리에만 기록해 재시작하면 다시 검색)"""
+        self._misses[cache_key] = time.time()
+    
+    def _schedule_flush(self):
+        """지연 저장 타이머 시작 (_db_lock을 잡은 상태에서 호출)"""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.CACHE_FLUSH_DELAY, self._save_cache)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
 
     def search_lyrics(self, title: str, artist: str, duration_ms: Optional[int] = None, multi_source: bool = False) -> Optional[str]:
         """
@@ -172,21 +378,45 @@ class LyricsFetcher:
             artist: 아티스트
             duration_ms: 곡 길이 (밀리초) - 유효성 검증용
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
-        import time as time_module
-        
         # 캐시 확인
         cache_key = self._get_cache_key(title, artist)
         cached_lyrics = self._load_from_cache(cache_key)
         
         # 캐시된 데이터가 있고 유효하면 사용
         if cached_lyrics:
-            if self._validate_lyrics(cached_lyrics, duration_ms):
+            if self._is_cache_valid(cache_key, cached_lyrics, duration_ms):
                 print(f"[가사] 캐시 적중: {title} - {artist}")
                 return cached_lyrics
             else:
                 print(f"[가사] 캐시된 가사 길이 불일치. 재검색 시도.")
+        elif self._is_recent_miss(cache_key):
+            print(f"[가사] 최근 검색 실패한 곡, 재검색 생략: {title} - {artist}")
+            return None
         
+        # 같은 곡을 이미 다른 스레드가 검색 중이면 새로 검색하지 않고 그 결과를 기다림
+        with self._inflight_lock:
+            event = self._inflight.get(cache_key)
+            is_owner = event is None
+            if is_owner:
+                event = self._inflight[cache_key] = threading.Event()
+        
+        if not is_owner:
+            print(f"[가사] 같은 곡 검색 진행 중, 결과 대기: {title} - {artist}")
+            event.wait(self.INFLIGHT_WAIT)
+            cached_lyrics = self._load_from_cache(cache_key)
+            if cached_lyrics and self._is_cache_valid(cache_key, cached_lyrics, duration_ms):
+                return cached_lyrics
+            return None
+        
+        try:
+            return self._search_parallel(cache_key, title, artist, duration_ms)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+            event.set()
+    
+    def _search_parallel(self, cache_key: tuple[str, str], title: str, artist: str, duration_ms: Optional[int]) -> Optional[str]:
+        """쿼리 x 프로바이더 병렬 검색 후 우선순위가 가장 높은 유효 결과를 캐시에 저장하고 반환"""
         print(f"[가사] 병렬 검색 시작: {title} - {artist} (길이: {duration_ms}ms)")
         
         # 검색어 생성
@@ -194,13 +424,15 @@ class LyricsFetcher:
         if not queries:
             queries = [f"{artist} {title}"]
         
-        # 검색 프로바이더 목록 (우선순위 순)
-        providers = ['musixmatch', 'lrclib', 'netease']
-        
-        # 모든 (쿼리 인덱스, 쿼리, 프로바이더) 조합 생성
+        # 모든 (쿼리 인덱스, 쿼리, 프로바이더) 조합 생성 (정규화 후 같은 검색은 한 번만)
         search_tasks = []
+        submitted = set()
         for query_idx, query in enumerate(queries[:self.MAX_SEARCH_ATTEMPTS]):
-            for provider in providers:
+            for provider in self.PROVIDERS:
+                pair = (query.casefold().strip(), provider)
+                if pair in submitted:
+                    continue
+                submitted.add(pair)
                 search_tasks.append((query_idx, query, provider))
         
         print(f"[가사] 총 {len(search_tasks)}개 검색 작업 병렬 실행")
@@ -209,66 +441,81 @@ class LyricsFetcher:
             """단일 검색 작업"""
             query_idx, query, provider = task
             try:
-                lrc = syncedlyrics.search(query, providers=[provider])
+                lrc = self._search_provider(query, provider)
                 if lrc:
                     return (query_idx, query, provider, lrc)
             except Exception:
                 pass
             return None
         
-        # 결과 수집 (우선순위별)
-        valid_results = []  # (query_idx, query, provider, lrc)
+        # 병렬 검색 (공용 스레드 풀)
+        # 완료되는 대로 깨어나서, 더 높은 우선순위 작업이 남아있지 않으면 바로 반환
+        futures = {self._executor.submit(search_single, task): task for task in search_tasks}
+        pending = set(futures)
+        best = None  # (query_idx, query, provider, lrc)
+        deadline = time.time() + self.PRIORITY_WAIT
         
-        # 병렬 검색 (최대 8개 동시 실행)
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            futures = {executor.submit(search_single, task): task for task in search_tasks}
-            start_time = time_module.time()
-            
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
+        try:
+            while pending:
+                # 유효 결과가 생긴 뒤에만 우선순위 대기 시간 적용
+                timeout = None if best is None else max(0.0, deadline - time.time())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                
+                if not done:
+                    # 대기 시간이 지났는데도 더 높은 순위가 안 오면, 현재 확보된 것 중 최선 반환
+                    print(f"[가사] 1순위 검색 지연. 현재 확보된 차선책 사용.")
+                    break
+                
+                for future in done:
+                    result = future.result()
+                    if not result:
+                        continue
                     query_idx, query, provider, lrc = result
                     
                     # 유효성 검증
                     if self._validate_lyrics(lrc, duration_ms):
                         print(f"[가사] 유효 결과 (우선순위 {query_idx+1}, 쿼리: {query[:30]}..., 소스: {provider})")
-                        
-                        # 1순위(최고 우선순위) 결과면 즉시 반환
-                        if query_idx == 0:
-                            print(f"[가사] 최우선 결과 사용! (즉시 반환)")
-                            self._save_to_cache(cache_key, lrc)
-                            executor.shutdown(wait=False, cancel_futures=True)
-                            return lrc
-                        
-                        # 그 외는 후보로 저장
-                        valid_results.append(result)
-                        
-                        # 타임아웃 체크 로직 개선:
-                        # 1. 1순위 결과가 아니고
-                        # 2. 충분한 시간(3.0초)이 지나지 않았으면 
-                        # -> 더 기다린다 (continue)
-                        elapsed = time_module.time() - start_time
-                        if elapsed < 3.0:
-                            continue
-                            
-                        # 3.0초가 지났는데도 1순위가 안 오면, 현재 확보된 것 중 최선 반환
-                        if valid_results:
-                            print(f"[가사] 1순위 검색 지연. 현재 확보된 차선책 사용.")
-                            break
-        
-        # 최우선 결과가 없었으면 후보 중 가장 높은 우선순위 선택
-        if valid_results:
-            # 쿼리 인덱스가 가장 낮은 것 선택 (우선순위 높은 것)
-            valid_results.sort(key=lambda x: x[0])
-            best = valid_results[0]
+                        if best is None or query_idx < best[0]:
+                            best = result
+                
+                if best is None:
+                    continue
+                
+                # 1순위(최고 우선순위) 결과면 즉시 반환
+                if best[0] == 0:
+                    print(f"[가사] 최우선 결과 사용! (즉시 반환)")
+                    break
+                
+                # 더 높은 우선순위 작업이 모두 끝났으면 더 기다릴 필요 없음
+                if not any(futures[f][0] < best[0] for f in pending):
+                    break
+        finally:
+            # 아직 시작하지 않은 작업은 취소 (진행 중인 요청은 백그라운드에서 마무리)
+            for future in pending:
+                future.cancel()
+        
+        if best:
             query_idx, query, provider, lrc = best
-            print(f"[가사] 차선 결과 사용 (우선순위 {query_idx+1}, 소스: {provider})")
+            if query_idx > 0:
+                print(f"[가사] 차선 결과 사용 (우선순위 {query_idx+1}, 소스: {provider})")
             self._save_to_cache(cache_key, lrc)
             return lrc
         
         print("[가사] 가사를 찾을 수 없음")
+        self._save_miss(cache_key)
         return None
     
+    def _is_cache_valid(self, cache_key: tuple[str, str], lyrics: str, duration_ms: Optional[int]) -> bool:
+        """캐시된 가사 유효성 확인 (같은 곡/길이로 이미 검증했으면 재검증 생략)"""
+        if not duration_ms:
+            return True
+        if self._last_validated == (cache_key, duration_ms):
+            return True
+        if self._validate_lyrics(lyrics, duration_ms):
+            self._last_validated = (cache_key, duration_ms)
+            return True
+        return False
+    
     def _validate_lyrics(self, lrc_text: str, target_duration_ms: Optional[int]) -> bool:
         """가사 유효성 검증 (곡 길이 비교)"""
         if not target_duration_ms or target_duration_ms == 0:
@@ -276,14 +523,19 @@ class LyricsFetcher:
             
         try:
             # 마지막 타임스탬프 찾기
-            # [mm:ss.xx] 형식
-            matches = re.findall(r'\[(\d+):(\d+(?:\.\d+)?)\]', lrc_text)
-            if not matches:
+            # [mm:ss.xx] 형식 - 끝부분만 먼저 스캔하고, 없을 때만 전체 스캔
+            last_match = None
+            tail_start = max(0, len(lrc_text) - self.VALIDATE_TAIL_CHARS)
+            for last_match in self.LRC_TIMESTAMP_PATTERN.finditer(lrc_text, tail_start):
+                pass
+            if last_match is None and tail_start > 0:
+                for last_match in self.LRC_TIMESTAMP_PATTERN.finditer(lrc_text):
+                    pass
+            if last_match is None:
                 return True # 타임스탬프가 없으면(단순 텍스트) 일단 통과하거나 실패 처리 (여기선 통과)
             
-            last_match = matches[-1]
-            minutes = int(last_match[0])
-            seconds = float(last_match[1])
+            minutes = int(last_match.group(1))
+            seconds = float(last_match.group(2))
             
             lrc_duration_ms = int((minutes * 60 + seconds) * 1000)
             
@@ -307,15 +559,18 @@ class LyricsFetcher:
         2. 불필요한 태그 제거
         3. 우선순위 선정 (Cover 제외)
         """
+        return list(self._build_search_queries(title, artist))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def _build_search_queries(cls, title: str, artist: str) -> tuple[str, ...]:
+        """검색어 생성 본체 (순수 함수이므로 (제목, 아티스트) 단위로 결과 캐싱)"""
         queries = []
         
         # 기본 전처리 함수
         def remove_noise(text):
             # MV, Official, Live, Lyrics 등 제거
-            keywords = ['official video', 'official audio', 'mv', 'm/v', 'flac', 'hq', 'lyrics', 'lyric video']
-            for kw in keywords:
-                text = re.sub(f'(?i){re.escape(kw)}', '', text)
-            return text.strip()
+            return cls.NOISE_KEYWORD_PATTERN.sub('', text).strip()
 
         # 1. 구분자로 분리 시도
         separators = [" / ", " | ", " # ", " : ", " - "]
@@ -336,7 +591,7 @@ class LyricsFetcher:
         clean_parts = []
         for part in parts:
             # 커버/By 키워드가 있으면 제외하거나 후순위
-            if re.search(r'(?i)(cover|by\s|performed by)', part):
+            if cls.COVER_PART_PATTERN.search(part):
                 continue
             clean_parts.append(part)
         
@@ -349,13 +604,13 @@ class LyricsFetcher:
         # 3. Candidate Title 정제 (괄호 삭제 등)
         # 3-1. 괄호 안의 내용이 아티스트 정보일 수 있으므로 추출 시도
         # 예: Enemy [Imagine Dragons] -> Imagine Dragons Enemy
-        featured_artists = re.findall(r'[\[\(\{]([^\]\)\}]+)[\]\)\}]', candidate_title)
+        featured_artists = cls.BRACKET_CONTENT_PATTERN.findall(candidate_title)
         
         # 3-2. 순수 제목 (괄호 제거)
-        clean_title = re.sub(r'[\[\(\{].*?[\]\)\}]', '', candidate_title)
+        clean_title = cls.BRACKET_PATTERN.sub('', candidate_title)
         clean_title = remove_noise(clean_title)
-        clean_title = re.sub(r'[^\w\s\-\']', ' ', clean_title).strip() # 특수문자 제거
-        clean_title = re.sub(r'\s+', ' ', clean_title).strip()
+        clean_title = cls._strip_special_chars(clean_title).strip() # 특수문자 제거
+        clean_title = ' '.join(clean_title.split())
         
         # 쿼리 생성 전략
         
@@ -375,7 +630,7 @@ class LyricsFetcher:
         # 전략 B: [업로더/채널] + [원본 제목] (커버가 아닌 경우에 유효)
         if artist and artist.lower() != 'unknown artist':
             # 커버 관련 키워드가 제목에 없을 때만 높은 우선순위
-            if not re.search(r'(?i)(cover|커버|歌ってみた|カバー)', title):
+            if not cls.COVER_TITLE_PATTERN.search(title):
                 queries.append(f"{artist} {title}")
         
         # 전략 C: [업로더] + [정제된 제목]
@@ -400,27 +655,30 @@ class LyricsFetcher:
                 seen.add(q_clean)
                 unique_queries.append(q)
                 
-        return unique_queries[:5]  # 상위 5개 시도
+        return tuple(unique_queries[:5])  # 상위 5개 시도
     
-    def _clean_string(self, text: str) -> str:
-        """문자열 전처리 (특수문자 및 노이즈 제거)"""
-        # 1. 괄호 안 내용 제거: [MV], (Official), 【Cover】 등
-        text = re.sub(r'\[.*?\]', ' ', text)
-        text = re.sub(r'\(.*?\)', ' ', text)
-        text = re.sub(r'\{.*?\}', ' ', text)
-        text = re.sub(r'【.*?】', ' ', text)
-        text = re.sub(r'「.*?」', ' ', text)
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def _clean_string(cls, text: str) -> str:
+        """문자열 전처리 (특수문자 및 노이즈 제거, 순수 함수이므로 결과 캐싱)"""
+        # 1. 괄호 안 내용 제거: [MV], (Official), 【Cover】 등 (여는 괄호가 있는 종류만)
+        for opener, pattern in cls.CLEAN_BRACKET_PATTERNS:
+            if opener in text:
+                text = pattern.sub(' ', text)
         
         # 2. 특수 키워드 제거
-        keywords = ['official video', 'mv', 'm/v', 'lyric video', 'lyrics', 'feat.', 'prod.', 'cover']
-        text_lower = text.lower()
-        for kw in keywords:
-            if kw in text_lower:
-                text = re.sub(f'(?i){re.escape(kw)}', '', text)
+        text = cls.CLEAN_KEYWORD_PATTERN.sub('', text)
         
         # 3. 특수문자 제거 후 공백 정리
-        text = re.sub(r'[^\w\s\-\']', ' ', text)  # 알파벳, 숫자, 공백, 하이픈, 따옴표 제외 제거
-        return re.sub(r'\s+', ' ', text).strip()
+        text = cls._strip_special_chars(text)  # 알파벳, 숫자, 공백, 하이픈, 따옴표 제외 제거
+        return ' '.join(text.split())  # 공백 정리 (split/join이 정규식보다 빠름)
+    
+    @classmethod
+    def _strip_special_chars(cls, text: str) -> str:
+        """특수문자를 공백으로 치환 (ASCII 문자열은 str.translate로 빠르게 처리)"""
+        if text.isascii():
+            return text.translate(cls.SPECIAL_CHAR_TABLE)
+        return cls.SPECIAL_CHAR_PATTERN.sub(' ', text)
 
 if __name__ == "__main__":
     fetcher = LyricsFetcher()
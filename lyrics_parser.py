@@ -2,12 +2,14 @@
 LRC 형식의 가사를 파싱하고 멤버 파트를 추출하는 모듈.
 """
 
+import bisect
 import re
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LyricLine:
     """파싱된 가사 한 줄"""
     timestamp_ms: Optional[int]  # 밀리초 단위 타임스탬프, 없으면 None
@@ -15,16 +17,18 @@ class LyricLine:
     member: Optional[str]        # 멤버 이름, 없으면 None
     translation: str = ""        # 번역 (추가됨)
     romanization: str = ""       # 발음 (추가됨)
+    timestamp_str: str = field(init=False, default="")  # MM:SS 형식 (생성 시 한 번만 계산)
     
-    @property
-    def timestamp_str(self) -> str:
-        """타임스탬프를 MM:SS 형식으로 반환"""
-        if self.timestamp_ms is None:
-            return ""
-        total_seconds = self.timestamp_ms // 1000
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+    def __post_init__(self):
+        """타임스탬프를 MM:SS 형식 문자열로 미리 계산"""
+        if self.timestamp_ms is not None:
+            minutes, seconds = divmod(self.timestamp_ms // 1000, 60)
+            self.timestamp_str = f"{minutes:02d}:{seconds:02d}"
+
+
+def _timeline_key(line: LyricLine) -> int:
+    """정렬/탐색 기준 시간 (타임스탬프 없는 줄은 0으로 취급)"""
+    return line.timestamp_ms if line.timestamp_ms is not None else 0
 
 
 class LyricsParser:
@@ -33,6 +37,14 @@ class LyricsParser:
     # [MM:SS.xx] 또는 [MM:SS:xx] 형식의 타임스탬프
     TIMESTAMP_PATTERN = re.compile(r'\[(\d{1,2}):(\d{2})(?:[.:])(\d{2,3})?\]')
     
+    # 한 줄 전체: 앞 공백 + (선택) 타임스탬프 + 공백 + 본문
+    # 전체 텍스트에 finditer 한 번으로 줄 분리와 타임스탬프 추출을 같이 처리
+    LINE_PATTERN = re.compile(r'^[^\S\n]*(?:' + TIMESTAMP_PATTERN.pattern + r')?[^\S\n]*(.*)$', re.MULTILINE)
+    
+    # 메타데이터 라인 ([ti:], [ar:], [al:], [作詞], [作曲] 등)
+    # 영문 2글자 태그 또는 일본어/중국어 메타데이터 태그
+    METADATA_PATTERN = re.compile(r'\[(?:[a-z]{2}:|(?:作詞|作曲|編曲|歌手|歌|词|曲|编曲)[\]:])', re.IGNORECASE)
+    
     # 멤버 파트 패턴들
     # [멤버명] 가사, (멤버명) 가사, 멤버명: 가사
     MEMBER_PATTERNS = [
@@ -41,12 +53,21 @@ class LyricsParser:
         re.compile(r'^([^:]+):\s*(.+)$'),            # RM: 가사
     ]
     
+    # 일반 문장의 시작으로 보는 접두어 (멤버 이름 오인 방지)
+    SENTENCE_STARTERS = ('i ', 'you ', 'we ', 'they ', 'he ', 'she ', 'it ',
+                         'the ', 'a ', 'an ', "i'm", "you're", "we're")
+    
+    # 파싱 결과를 기억하는 최근 가사 수 (같은 가사 재적용 시 재사용)
+    PARSE_CACHE_SIZE = 16
+    
     def __init__(self, known_members: Optional[set[str]] = None):
         """
         Args:
             known_members: 알려진 멤버 이름 집합 (멤버 파트 감지 정확도 향상)
         """
         self.known_members = known_members or set()
+        self._parse_cache: dict[str, tuple[LyricLine, ...]] = {}  # 가사 텍스트 -> 파싱 결과 (최근 사용 순)
+        self._parse_cache_lock = threading.Lock()  # UI 스레드와 검색 스레드에서 동시에 호출됨
     
     def parse(self, lyrics_text: str) -> list[LyricLine]:
         """
@@ -61,67 +82,60 @@ class LyricsParser:
         if not lyrics_text:
             return []
         
-        lines = []
-        raw_lines = lyrics_text.strip().split('\n')
-        
-        for raw_line in raw_lines:
-            parsed = self._parse_line(raw_line)
-            if parsed:
-                lines.append(parsed)
-        
-        # 타임스탬프 기준 정렬
-        lines.sort(key=lambda x: x.timestamp_ms if x.timestamp_ms is not None else 0)
-        
-        return lines
+        # 같은 가사를 다시 적용하는 경우 캐시된 결과 사용
+        # 번역/발음이 줄 객체에 직접 기록되므로 캐시 원본이 아닌 새 객체로 반환
+        with self._parse_cache_lock:
+            parsed = self._parse_cache.pop(lyrics_text, None)
+            if parsed is not None:
+                self._parse_cache[lyrics_text] = parsed
+        if parsed is None:
+            # 파싱은 잠금 밖에서 수행 (다른 스레드가 오래 기다리지 않도록)
+            parsed = self._parse_lines(lyrics_text)
+            with self._parse_cache_lock:
+                self._parse_cache.pop(lyrics_text, None)
+                while len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+                    self._parse_cache.pop(next(iter(self._parse_cache)))  # 가장 오래전에 사용한 항목 제거
+                self._parse_cache[lyrics_text] = parsed
+        
+        return [LyricLine(line.timestamp_ms, line.text, line.member) for line in parsed]
     
-    def _parse_line(self, line: str) -> Optional[LyricLine]:
-        """단일 라인 파싱"""
-        line = line.strip()
-        if not line:
-            return None
-        
-        # 메타데이터 라인 무시 ([ti:], [ar:], [al:], [作詞], [作曲] 등)
-        # 영문 2글자 태그 또는 일본어/중국어 메타데이터 태그
-        if re.match(r'^\[[a-z]{2}:', line, re.IGNORECASE):
-            return None
-        
-        # 일본어/중국어 메타데이터 태그 필터링
-        metadata_tags = ['作詞', '作曲', '編曲', '歌手', '歌', '词', '曲', '编曲']
-        for tag in metadata_tags:
-            if line.startswith(f'[{tag}]') or line.startswith(f'[{tag}:'):
-                return None
-        
-        # 타임스탬프 추출
-        timestamp_ms = None
-        timestamp_match = self.TIMESTAMP_PATTERN.match(line)
+    def _parse_lines(self, lyrics_text: str) -> tuple[LyricLine, ...]:
+        """파싱 본체 (결과는 캐시에 보관되므로 외부에 그대로 내보내지 않음)"""
+        lines = []
         
-        if timestamp_match:
-            minutes = int(timestamp_match.group(1))
-            seconds = int(timestamp_match.group(2))
-            centiseconds = int(timestamp_match.group(3) or 0)
+        for match in self.LINE_PATTERN.finditer(lyrics_text):
+            minutes, seconds, fraction, line = match.groups()
+            line = line.rstrip()
+            if not line:
+                continue
             
-            # 3자리면 밀리초, 2자리면 센티초
-            if timestamp_match.group(3) and len(timestamp_match.group(3)) == 3:
-                milliseconds = centiseconds
+            timestamp_ms = None
+            if minutes is None:
+                # 메타데이터 라인 무시 (타임스탬프가 있는 줄은 메타데이터가 아님)
+                if self.METADATA_PATTERN.match(line):
+                    continue
             else:
-                milliseconds = centiseconds * 10
+                # 3자리면 밀리초, 2자리면 센티초
+                if fraction and len(fraction) == 3:
+                    milliseconds = int(fraction)
+                else:
+                    milliseconds = int(fraction or 0) * 10
+                
+                timestamp_ms = (int(minutes) * 60 + int(seconds)) * 1000 + milliseconds
             
-            timestamp_ms = (minutes * 60 + seconds) * 1000 + milliseconds
+            # 멤버 파트 추출
+            member, text = self._extract_member(line)
             
-            # 타임스탬프 제거
-            line = line[timestamp_match.end():].strip()
-        
-        if not line:
-            return None
+            lines.append(LyricLine(
+                timestamp_ms=timestamp_ms,
+                text=text,
+                member=member
+            ))
         
-        # 멤버 파트 추출
-        member, text = self._extract_member(line)
+        # 타임스탬프 기준 정렬
+        lines.sort(key=_timeline_key)
         
-        return LyricLine(
-            timestamp_ms=timestamp_ms,
-            text=text,
-            member=member
-        )
+        return tuple(lines)
     
     def _extract_member(self, text: str) -> tuple[Optional[str], str]:
         """텍스트에서 멤버 이름 추출"""
@@ -145,37 +159,27 @@ class LyricsParser:
         if len(text) > 20:
             return True
         
-        # 일반적인 문장 시작 패턴
-        sentence_starters = ['i ', 'you ', 'we ', 'they ', 'he ', 'she ', 'it ', 
-                            'the ', 'a ', 'an ', "i'm", "you're", "we're"]
-        text_lower = text.lower()
-        
-        for starter in sentence_starters:
-            if text_lower.startswith(starter):
-                return True
-        
-        return False
+        # 일반적인 문장 시작 패턴 (튜플로 한 번에 비교)
+        return text.lower().startswith(self.SENTENCE_STARTERS)
     
     def get_current_line(self, lines: list[LyricLine], current_time_ms: int) -> Optional[int]:
         """
-        현재 시간에 해당하는 가사 라인 인덱스 반환
+        현재 시간에 해당하는 가사 라인 인덱스 반환 (이진 탐색)
         
         Args:
-            lines: 파싱된 가사 라인 리스트
+            lines: parse()로 얻은 (시간순 정렬된) 가사 라인 리스트
             current_time_ms: 현재 재생 시간 (밀리초)
             
         Returns:
             현재 라인의 인덱스, 없으면 None
         """
-        current_idx = None
+        idx = bisect.bisect_right(lines, current_time_ms, key=_timeline_key) - 1
         
-        for i, line in enumerate(lines):
-            if line.timestamp_ms is not None and line.timestamp_ms <= current_time_ms:
-                current_idx = i
-            elif line.timestamp_ms is not None and line.timestamp_ms > current_time_ms:
-                break
+        # 타임스탬프 없는 줄은 건너뛰고 직전의 타임스탬프 있는 줄 선택
+        while idx >= 0 and lines[idx].timestamp_ms is None:
+            idx -= 1
         
-        return current_idx
+        return idx if idx >= 0 else None
 
 
 if __name__ == "__main__":
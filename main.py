@@ -3,13 +3,16 @@ YouTube Music 가사 오버레이 애플리케이션
 메인 진입점 - 모든 모듈을 통합하여 실행합니다.
 """
 
+import bisect
+import importlib.util
+import functools
 import threading
 import time
 import os
 import sys
 import re
 import tkinter as tk
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
 from typing import Optional
 
 from settings_manager import SettingsManager
@@ -20,26 +23,30 @@ from overlay_ui import LyricsOverlay, LyricDisplayLine
 
 # 재생 시간 및 타임라인
 try:
-    from media_session import get_playback_position_ms
+    from media_session import get_playback_position_ms, is_playing
     TIMELINE_AVAILABLE = True
 except ImportError:
     TIMELINE_AVAILABLE = False
     get_playback_position_ms = lambda: None
+    is_playing = lambda: None
 
 # 번역 모듈 (선택적)
-try:
-    from translator import LyricsTranslator
-    TRANSLATION_AVAILABLE = True
-except ImportError:
-    TRANSLATION_AVAILABLE = False
+# 의존성이 무거우므로 여기서는 설치 여부만 확인하고, 실제 로드는 첫 번역 시 백그라운드에서 수행
+TRANSLATION_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ("langdetect", "deep_translator", "pykakasi")
+)
+if not TRANSLATION_AVAILABLE:
     print("[경고] 번역 모듈 로드 실패. 번역 기능이 비활성화됩니다.")
 
 # 시스템 트레이 (선택적)
-try:
-    from system_tray import SystemTray, TRAY_AVAILABLE
-except ImportError:
-    TRAY_AVAILABLE = False
-    SystemTray = None
+# pystray/PIL 로드가 첫 화면 표시를 늦추지 않도록 설치 여부만 확인하고, 실제 로드는 창이 뜬 뒤 수행
+TRAY_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ("pystray", "PIL")
+)
+if not TRAY_AVAILABLE:
+    print("[경고] pystray 또는 pillow가 설치되지 않음. 트레이 아이콘 비활성화.")
 
 
 class LyricsApp:
@@ -48,9 +55,20 @@ class LyricsApp:
     POLL_INTERVAL_MS = 500  # 곡 변경 감지 간격 (0.5초 - 빠른 감지)
     SYNC_INTERVAL_MS = 500   # 가사 동기화 간격 (0.5초)
     POLL_INTERVAL_SLOW_MS = 5000  # 최소화 시 감지 간격 (5초)
+    POLL_INTERVAL_BACKUP_MS = 5000  # Media Session 이벤트 수신 중 백업 감지 간격 (5초)
     SYNC_INTERVAL_SLOW_MS = 2000  # 최소화 시 동기화 간격 (2초)
+    SYNC_INTERVAL_MIN_MS = 20  # 다음 줄 시작에 맞춰 깨어날 때의 최소 간격
     DEFAULT_COLOR = "#e0e0e0"  # 기본 가사 색상 (밝은 회색)
     HIGHLIGHT_COLOR = "#ff6b6b"  # 현재 가사 색상 (빨간색 계열)
+    TRANSLATION_REFRESH_MS = 200  # 번역 결과를 모아서 화면에 반영하는 간격
+    TRANSLATION_WORKERS = 4  # 동시에 요청하는 번역 배치 수
+    FETCH_WORKERS = 4  # 동시에 진행하는 곡별 가사 검색 수
+    
+    # 검색 필드 추천용 패턴 (검색 패널을 열 때마다 다시 컴파일하지 않도록 미리 컴파일)
+    TITLE_BRACKET_CONTENT_PATTERN = re.compile(r'[\[\(\{]([^\]\)\}]+)[\]\)\}]')  # 괄호 안 내용
+    TITLE_BRACKET_PATTERN = re.compile(r'[\[\(\{].*?[\]\)\}]')  # 괄호 통째로
+    COVER_PATTERN = re.compile(r'cover|커버', re.IGNORECASE)
+    TITLE_BRACKET_OPENERS = '[({'
     
     def __init__(self):
         # 0. UI 루트 (가장 먼저)
@@ -65,8 +83,10 @@ class LyricsApp:
         self.lyrics_fetcher = LyricsFetcher()
         self.lyrics_parser = LyricsParser()
         
-        # 번역 모듈
-        self.translator = LyricsTranslator() if TRANSLATION_AVAILABLE else None
+        # 번역 모듈 (첫 번역 시 _ensure_translator에서 생성)
+        self.translator = None
+        self._translation_enabled = TRANSLATION_AVAILABLE
+        self._translator_lock = threading.Lock()
         
         # 3. UI - 오버레이 생성
         self.overlay = LyricsOverlay()
@@ -83,29 +103,48 @@ class LyricsApp:
         self._current_track: Optional[TrackInfo] = None
         self._current_lyrics: list[LyricLine] = []
         self._current_line_index: int = -1
+        # 타임스탬프 있는 줄의 (시간 목록, 원래 인덱스 목록) - 가사가 바뀔 때만 다시 만듦 (동기화 틱마다 이진 탐색)
+        self._timeline_source: Optional[list[LyricLine]] = None
+        self._timeline_ms: list[int] = []
+        self._timeline_index: list[int] = []
+        # 곡/가사가 바뀔 때마다 증가 (늦게 끝난 이전 검색/번역 결과가 현재 가사를 덮어쓰지 않도록)
+        self._req_id = 0
+        # 수동 검색 요청마다 증가 (먼저 보낸 검색 결과가 나중 결과를 덮어쓰지 않도록)
+        self._search_id = 0
+        
+        # 화면에 표시 중인 가사 (현재 줄만 바뀌면 전체를 다시 만들지 않음)
+        self._display_lines: list[LyricDisplayLine] = []
+        self._display_source: Optional[list[LyricLine]] = None  # _display_lines를 만든 가사 리스트
+        self._display_current = 0  # _display_lines에서 하이라이트된 줄
+        self._display_dirty = False  # 설정 변경 등으로 전체 다시 그리기가 필요한지
+        self._translated_lines: set[int] = set()  # 번역이 도착해 화면에 반영할 줄 (해당 줄만 갱신)
+        self._translated_lines_lock = threading.Lock()
+        self._refresh_scheduled = False  # 번역 반영 다시 그리기가 예약되어 있는지
         
         # 번역 스레드 제어용
-        self._translation_thread: Optional[threading.Thread] = None
+        self._translation_future: Optional[Future] = None
         self._stop_translation = False
+        # 마지막 언어 감지 결과 (가사 전체 텍스트, 번역 필요 여부) - 같은 가사로 번역 재시작 시 재사용
+        self._translation_verdict: Optional[tuple[tuple[str, ...], bool]] = None
         
         # 싱크 조절
         self._sync_offset = 0
+        # 예약된 다음 가사 동기화 틱 (재생 상태 변경/새 가사 적용 시 취소하고 바로 동기화)
+        self._sync_after_id: Optional[str] = None
         
-        # 5. 시스템 트레이 초기화
+        # 5. 시스템 트레이 (run()에서 첫 화면 표시 후 _start_tray로 생성)
         self.tray = None
-        if TRAY_AVAILABLE and SystemTray:
-            try:
-                self.tray = SystemTray()
-                self.tray.set_on_center_window(self._center_overlay)
-                self.tray.set_on_show_window(self._show_overlay)
-                self.tray.set_on_toggle_click_through(self._toggle_click_through)
-                if hasattr(self.tray, 'set_on_exit'):
-                    self.tray.set_on_exit(self.quit)
-            except Exception as e:
-                print(f"[메인] 트레이 초기화 실패: {e}")
         
         # 스레드 풀
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.executor = ThreadPoolExecutor(max_workers=self.FETCH_WORKERS, thread_name_prefix='fetch')
+        # 진행 중인 가사 검색 ((제목, 아티스트) -> Future) - 같은 곡은 한 번만 검색
+        self._inflight_fetches: dict[tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # 번역 배치 동시 요청용 (번역 서비스 요청 제한을 고려해 작게 유지)
+        self._translation_executor = ThreadPoolExecutor(max_workers=self.TRANSLATION_WORKERS, thread_name_prefix='translate')
+        # 수동 적용 후 번역 재시작용 (스레드 하나를 재사용, 연속 적용 시 대기 중인 재시작은 취소)
+        self._translation_restart_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='translate-restart')
+        self._translation_restart_future = None
         self._running = True
         
         # 초기 설정 적용
@@ -155,6 +194,9 @@ class LyricsApp:
         font_family = settings.get("font_family", "Malgun Gothic")
         font_size = settings.get("font_size", 11)
         self.overlay.set_font(font_family, font_size)
+        
+        # 색상/폰트가 바뀌었으므로 다음 가사 갱신 때는 전체 다시 그리기
+        self._display_dirty = True
 
         
         # 5. 기타 설정 적용 (필요 시) # Kept this comment
@@ -182,14 +224,14 @@ class LyricsApp:
         # 초기 색상 및 설정 적용 # Removed, handled by _apply_settings
         # self._apply_settings_to_components()
         
-        # 시스템 트레이 시작
-        initial_click_through = self.settings.get("click_through_mode", False) # Use self.settings
-        if self.tray:
-            self.tray.start(initial_click_through_state=initial_click_through)
+        # 시스템 트레이 시작 (첫 화면이 뜬 뒤 로드)
+        if TRAY_AVAILABLE:
+            self.overlay.schedule(0, self._start_tray)
         
-        # 폴링 기반 곡 감지 (이벤트 모드는 asyncio 충돌 문제로 비활성화)
-        self._check_track()
-        self._schedule_track_check()
+        # 곡 감지 (Media Session 변경 이벤트가 오면 즉시, 그 외에는 백업 폴링)
+        # Media Session 호출이 UI를 막지 않도록 백그라운드 스레드에서 폴링
+        self._poll_thread = threading.Thread(target=self._poll_track_loop, daemon=True)
+        self._poll_thread.start()
         
         
         # 싱크 조절 콜백 연결
@@ -207,10 +249,30 @@ class LyricsApp:
             
         self.overlay.run()
     
+    def _start_tray(self):
+        """시스템 트레이 모듈 로드 및 시작 (UI 스레드에서 호출)"""
+        if not self._running:
+            return
+        try:
+            from system_tray import SystemTray
+            self.tray = SystemTray()
+            self.tray.set_on_center_window(self._center_overlay)
+            self.tray.set_on_show_window(self._show_overlay)
+            self.tray.set_on_toggle_click_through(self._toggle_click_through)
+            if hasattr(self.tray, 'set_on_exit'):
+                self.tray.set_on_exit(self.quit)
+            
+            initial_click_through = self.settings.get("click_through_mode", False)
+            self.tray.start(initial_click_through_state=initial_click_through)
+        except Exception as e:
+            self.tray = None
+            print(f"[메인] 트레이 초기화 실패: {e}")
+    
     def _on_track_changed_event(self, track):
         """이벤트 기반 곡 변경 처리 (즉시 호출됨)"""
         if track != self._current_track:
             self._current_track = track
+            self._req_id += 1
             self._current_line_index = -1
             self._sync_offset = 0
             
@@ -219,7 +281,7 @@ class LyricsApp:
             if self.overlay.is_alive():
                 self.overlay.reset_sync_control()
             
-            self._stop_translation = True
+            self._cancel_translation()
             
             if track:
                 print(f"[이벤트감지] 곡 변경: {track.title} - {track.artist}")
@@ -241,83 +303,146 @@ class LyricsApp:
         
         self.overlay.queue_command(show)
             
-    def _schedule_track_check(self):
-        """곡 감지 스케줄"""
-        if self._running and self.overlay.is_alive():
-            self._check_track()
-            # 최소화 시 폴링 간격 증가
-            interval = self.POLL_INTERVAL_SLOW_MS if self.overlay.is_minimized() else self.POLL_INTERVAL_MS
-            self.overlay.schedule(interval, self._schedule_track_check)
+    def _poll_track_loop(self):
+        """곡 감지 폴링 (백그라운드 스레드) - 곡이 바뀐 경우에만 UI 스레드로 전달"""
+        last_track = None
+        last_playing = None
+        while self._running:
+            try:
+                track = self.track_detector.get_current_track()
+            except Exception as e:
+                print(f"[메인] 곡 감지 오류: {e}")
+                track = last_track
+            
+            if track != last_track:
+                last_track = track
+                self.overlay.queue_command(lambda t=track: self._check_track(t))
+            
+            # 재생/일시정지 전환 이벤트를 놓쳐도 백업 폴링에서 가사 위치에 반영
+            playing = is_playing()
+            if playing != last_playing:
+                last_playing = playing
+                self.overlay.queue_command(self._on_playback_changed)
+            
+            # 최소화 시, 또는 변경 이벤트를 받고 있으면 폴링 간격 증가 (이벤트가 오면 즉시 깨어남)
+            if self.overlay.is_minimized():
+                interval = self.POLL_INTERVAL_SLOW_MS
+            elif self.track_detector.is_event_mode:
+                interval = self.POLL_INTERVAL_BACKUP_MS
+            else:
+                interval = self.POLL_INTERVAL_MS
+            
+            if self.track_detector.wait_for_change(interval / 1000):
+                # 재생/일시정지/탐색 등 재생 상태 변경은 가사 위치에도 바로 반영
+                self.overlay.queue_command(self._on_playback_changed)
+    
+    def _on_playback_changed(self):
+        """재생 상태/위치 변경 이벤트 처리 (UI 스레드) - 일시정지 중 느려진 동기화 틱을 바로 실행"""
+        self._resync_lyrics()
+    
+    def _resync_lyrics(self):
+        """예약된 동기화 틱을 취소하고 지금 동기화 (다음 틱은 현재 상태에 맞춰 다시 예약)"""
+        if self._sync_after_id is None:
+            # 동기화 틱이 돌고 있지 않으면 (타임라인 미지원 등) 한 번만 반영
+            self._sync_lyrics()
+            return
+        self.overlay.cancel_schedule(self._sync_after_id)
+        self._schedule_lyrics_sync()
     
     def _schedule_lyrics_sync(self):
         """가사 동기화 스케줄"""
-        if self._running and self.overlay.is_alive():
+        overlay = self.overlay  # 매 틱 반복되는 속성 조회를 줄이기 위해 지역 변수로 바인딩
+        if not (self._running and overlay.is_alive()):
+            return
+        # 동기화 중 예외가 나도 다음 틱은 예약 (한 번의 읽기 오류로 동기화가 멈추지 않도록)
+        interval = self.SYNC_INTERVAL_MS
+        try:
+            minimized = overlay.is_minimized()
+            paused = is_playing() is False
+            next_line_ms = None
             # 최소화 시 동기화 안 함
-            if not self.overlay.is_minimized():
-                self._sync_lyrics()
-            # 최소화 시 폴링 간격 증가
-            interval = self.SYNC_INTERVAL_SLOW_MS if self.overlay.is_minimized() else self.SYNC_INTERVAL_MS
-            self.overlay.schedule(interval, self._schedule_lyrics_sync)
+            # 일시정지 중에도 느린 간격으로 동기화 (탐색/재생 재개 이벤트를 놓쳐도 위치 반영)
+            if not minimized:
+                next_line_ms = self._sync_lyrics()
+            # 최소화 또는 일시정지 시 폴링 간격 증가 (재생 상태 변경 이벤트가 오면 _resync_lyrics로 바로 실행)
+            if minimized or paused:
+                interval = self.SYNC_INTERVAL_SLOW_MS
+            # 다음 줄이 그 전에 시작하면 그 시점에 맞춰 깨어남 (하이라이트 지연 최소화)
+            elif next_line_ms is not None:
+                interval = max(self.SYNC_INTERVAL_MIN_MS, min(interval, next_line_ms + 1))
+        finally:
+            self._sync_after_id = overlay.schedule(interval, self._schedule_lyrics_sync)
 
     
-    def _delayed_start_polling(self):
-        """지연 폴링 시작 (이벤트 루프 충돌 방지)"""
-        self._check_track()
-        self._schedule_track_check()
-    
-    def _schedule_track_check_slow(self):
-        """저속 폴링 (백업용, 이벤트 모드에서만 사용)"""
-        if self._running and self.overlay.is_alive():
-            # 이벤트 모드가 아니면 일반 폴링으로 전환
-            if not self.track_detector.is_event_mode:
-                self._schedule_track_check()
-                return
-            
-            # 3초마다 백업 체크 (이벤트 누락 대비)
-            self._check_track()
-            self.overlay.schedule(3000, self._schedule_track_check_slow)
-    
     def _on_search_request(self):
         """검색 패널 열릴 때 호출 - 검색 필드 업데이트"""
         if not self._current_track:
             return
-            
-        current_title = self._current_track.title
-        current_artist = self._current_track.artist
         
-        # 제목에서 원곡 아티스트 추출 시도 (괄호 내용)
-        extracted_artists = re.findall(r'[\[\(\{]([^\]\)\}]+)[\]\)\}]', current_title)
+        clean_title, suggested_artist = self._suggest_search_fields(
+            self._current_track.title, self._current_track.artist
+        )
         
-        # 추출된 아티스트 중 원곡 정보일 가능성이 높은 것 선택
+        # 검색 필드 업데이트
+        self.overlay.update_search_fields(clean_title, suggested_artist)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _suggest_search_fields(cls, current_title: str, current_artist: str) -> tuple[str, str]:
+        """제목/업로더에서 검색 필드 추천값 (정제된 제목, 원곡 아티스트) 계산 (순수 함수이므로 결과 캐싱)"""
         suggested_artist = current_artist  # 기본값은 업로더
-        for feat in extracted_artists:
-            if ' - ' in feat:
-                parts = feat.split(' - ')
-                suggested_artist = parts[1].strip() if len(parts) > 1 else parts[0].strip()
-                break
-            elif not re.search(r'(?i)(cover|커버)', feat) and len(feat) > 2:
-                suggested_artist = feat.strip()
-                break
-        
-        # 정제된 제목 (괄호 제거)
-        clean_title = re.sub(r'[\[\(\{].*?[\]\)\}]', '', current_title)
-        clean_title = re.sub(r'\s+', ' ', clean_title).strip()
+        clean_title = current_title
+        
+        # 괄호가 없으면 괄호 관련 패턴 검사 생략
+        if any(bracket in current_title for bracket in cls.TITLE_BRACKET_OPENERS):
+            # 제목에서 원곡 아티스트 추출 시도 (괄호 내용)
+            # 추출된 아티스트 중 원곡 정보일 가능성이 높은 것 선택
+            for feat in cls.TITLE_BRACKET_CONTENT_PATTERN.findall(current_title):
+                if ' - ' in feat:
+                    parts = feat.split(' - ')
+                    suggested_artist = parts[1].strip() if len(parts) > 1 else parts[0].strip()
+                    break
+                elif not cls.COVER_PATTERN.search(feat) and len(feat) > 2:
+                    suggested_artist = feat.strip()
+                    break
+            
+            # 정제된 제목 (괄호 제거)
+            clean_title = cls.TITLE_BRACKET_PATTERN.sub('', current_title)
+        
+        clean_title = ' '.join(clean_title.split())  # 공백 정리 (split/join이 정규식보다 빠름)
         if ' / ' in clean_title:
             clean_title = clean_title.split(' / ')[0].strip()
         
-        # 검색 필드 업데이트
-        self.overlay.update_search_fields(clean_title, suggested_artist)
+        return clean_title, suggested_artist
     
     def _do_search_action(self, title: str, artist: str):
-        """검색 버튼 클릭 시 실행"""
-        query = f"{artist} {title}"
-        results = self.lyrics_fetcher.search_candidates(query)
+        """검색 버튼 클릭 시 실행 (검색은 백그라운드, 결과는 UI 스레드에서 표시)"""
+        self._search_id += 1
+        search_id = self._search_id
+        
+        def search_worker():
+            try:
+                # 아티스트/제목 순서를 바꾼 검색어도 함께 병렬 검색 (중복 결과는 fetcher에서 제거)
+                results = self.lyrics_fetcher.search_candidates(f"{artist} {title}", f"{title} {artist}")
+            except Exception as e:
+                print(f"[검색] 수동 검색 오류: {e}")
+                results = []
+            self.overlay.queue_command(lambda: self._show_search_results(search_id, results))
+        
+        self.executor.submit(search_worker)
+    
+    def _show_search_results(self, search_id: int, results: list[tuple[str, str]]):
+        """수동 검색 결과 표시 (UI 스레드) - 그 사이 다시 검색했으면 이전 결과는 버림"""
+        if search_id != self._search_id or not self.overlay.is_alive():
+            return
         self.overlay.update_search_results(results)
     
     def _apply_lyrics_action(self, lrc_content: str, source_name: str):
         """가사 적용"""
         print(f"[수동적용] 선택된 가사 적용 (출처: {source_name})")
         
+        # 아직 진행 중인 자동 검색 결과가 수동 적용한 가사를 덮어쓰지 않도록
+        self._req_id += 1
         self._current_lyrics = self.lyrics_parser.parse(lrc_content)
         self._current_line_index = -1
         self._sync_offset = 0
@@ -325,14 +450,19 @@ class LyricsApp:
         
         if self.overlay.is_alive():
             self.overlay.schedule(0, self._display_lyrics)
+            # 일시정지 중이어도 현재 위치의 줄로 이동
+            self.overlay.schedule(0, self._resync_lyrics)
             
         if self._current_track:
-            cache_key = self.lyrics_fetcher._get_cache_key(self._current_track.title, self._current_track.artist)
-            self.lyrics_fetcher._save_to_cache(cache_key, lrc_content)
-        
-        if self.translator and self._current_track:
-            self._stop_translation = True
-            threading.Thread(target=lambda: self._start_translation_delayed(self._current_track), daemon=True).start()
+            self.lyrics_fetcher.cache_put(self._current_track.title, self._current_track.artist, lrc_content)
+        
+        if self._translation_enabled and self._current_track:
+            self._cancel_translation()
+            if self._translation_restart_future is not None:
+                self._translation_restart_future.cancel()
+            self._translation_restart_future = self._translation_restart_executor.submit(
+                self._start_translation_delayed, self._current_track
+            )
 
     def _start_translation_delayed(self, track):
         """번역 재시작 (딜레이)"""
@@ -341,12 +471,11 @@ class LyricsApp:
     
 
             
-    def _check_track(self):
-        """현재 곡 확인 및 업데이트"""
-        track = self.track_detector.get_current_track()
-        
+    def _check_track(self, track: Optional[TrackInfo]):
+        """감지된 곡 반영 (UI 스레드에서 호출)"""
         if track != self._current_track:
             self._current_track = track
+            self._req_id += 1
             self._current_line_index = -1
             self._sync_offset = 0  # 싱크 오프셋 초기화
             
@@ -357,7 +486,7 @@ class LyricsApp:
                 self.overlay.reset_sync_control() # UI 슬라이더 초기화
             
             # 이전 번역 중단
-            self._stop_translation = True
+            self._cancel_translation()
             
             if track:
                 self._on_track_changed(track)
@@ -371,93 +500,216 @@ class LyricsApp:
         self.overlay.update_track_info(track.title, track.artist)
         self.overlay.show_loading_message()
         
-        # 가사 검색 (백그라운드)
-        def fetch_lyrics():
-            # 설정에 따라 검색 수행
-            multi_source = self.settings.get("multi_source_search", False)
-            lyrics_text = self.lyrics_fetcher.search_lyrics(track.title, track.artist, track.duration_ms, multi_source=multi_source)
-            
-            if not self._running or self._current_track != track:
-                return
-                
-            if lyrics_text:
-                # 파싱
-                self._current_lyrics = self.lyrics_parser.parse(lyrics_text)
-                self._current_line_index = -1
-                
-                # 가사 먼저 표시
-                if self.overlay.is_alive():
-                    self.overlay.schedule(0, self._display_lyrics)
-                
-                # 번역 시작
-                if self.translator:
-                    self._start_translation(track)
+        # 가사 검색 (백그라운드, 같은 곡을 이미 검색 중이면 그 결과를 기다림)
+        key = (track.title, track.artist)
+        with self._inflight_lock:
+            stale = [other for other_key, other in self._inflight_fetches.items() if other_key != key]
+            future = self._inflight_fetches.get(key)
+            if future is None:
+                multi_source = self.settings.get("multi_source_search", False)
+                future = self.executor.submit(
+                    self.lyrics_fetcher.search_lyrics, track.title, track.artist, track.duration_ms,
+                    multi_source=multi_source
+                )
+                self._inflight_fetches[key] = future
+                future.add_done_callback(functools.partial(self._forget_fetch, key))
             else:
-                # 자동검색 실패 시 수동검색 팝업 자동 표시
-                if self.overlay.is_alive():
-                    print("[가사] 자동검색 실패, 수동검색 패널 표시")
-                    
-                    def show_manual_search():
-                        # 검색 필드 업데이트
-                        self._on_search_request()
-                        # 검색 패널 열기
-                        self.overlay.show_search_panel()
-                        # "검색 실패" 메시지 표시
-                        self.overlay.show_loading_message("❌ 가사를 찾을 수 없습니다. 수동으로 검색해 주세요.")
-                    
-                    self.overlay.schedule(0, show_manual_search)
+                print(f"[가사] 이미 검색 중인 곡, 기존 검색 결과 사용: {track.title} - {track.artist}")
+        
+        # 다른 곡의 아직 시작하지 않은 검색은 취소 (빠르게 곡을 넘길 때 대기열이 쌓이지 않도록)
+        # 취소 시 완료 콜백이 바로 호출되므로 잠금 밖에서 처리
+        for other in stale:
+            other.cancel()
         
-        thread = threading.Thread(target=fetch_lyrics, daemon=True)
-        thread.start()
+        future.add_done_callback(functools.partial(self._on_lyrics_fetched, track, self._req_id))
+    
+    def _forget_fetch(self, key: tuple[str, str], future: Future):
+        """끝난 가사 검색을 진행 중 목록에서 제거"""
+        with self._inflight_lock:
+            if self._inflight_fetches.get(key) is future:
+                del self._inflight_fetches[key]
+    
+    def _on_lyrics_fetched(self, track: TrackInfo, req_id: int, future: Future):
+        """가사 검색 완료 처리 (검색 스레드에서 호출) - 파싱만 여기서 하고 적용은 UI 스레드에서"""
+        if not self._running or req_id != self._req_id:
+            return
+        
+        try:
+            lyrics_text = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            print(f"[가사] 검색 오류: {e}")
+            lyrics_text = None
+        
+        lyrics = self.lyrics_parser.parse(lyrics_text) if lyrics_text else None
+        self.overlay.queue_command(lambda: self._apply_fetched_lyrics(track, req_id, lyrics))
+    
+    def _apply_fetched_lyrics(self, track: TrackInfo, req_id: int, lyrics: Optional[list[LyricLine]]):
+        """검색된 가사 적용 (UI 스레드) - 그 사이 곡이 바뀌었거나 수동 적용했으면 버림"""
+        if not self._running or req_id != self._req_id or not self.overlay.is_alive():
+            return
+        
+        if lyrics:
+            self._current_lyrics = lyrics
+            self._current_line_index = -1
+            
+            # 가사 먼저 표시 (일시정지 중이어도 현재 위치의 줄로 이동)
+            self._display_lyrics()
+            self._resync_lyrics()
+            
+            # 번역 시작
+            if self._translation_enabled:
+                self._start_translation(track)
+        else:
+            # 자동검색 실패 시 수동검색 팝업 자동 표시
+            print("[가사] 자동검색 실패, 수동검색 패널 표시")
+            # 검색 필드 업데이트
+            self._on_search_request()
+            # 검색 패널 열기
+            self.overlay.show_search_panel()
+            # "검색 실패" 메시지 표시
+            self.overlay.show_loading_message("❌ 가사를 찾을 수 없습니다. 수동으로 검색해 주세요.")
+    
+    def _ensure_translator(self):
+        """번역기 반환 (최초 호출 시 번역 모듈 로드, 실패하면 번역 비활성화)"""
+        with self._translator_lock:
+            if self.translator is None and self._translation_enabled:
+                try:
+                    from translator import LyricsTranslator
+                    self.translator = LyricsTranslator()
+                except Exception as e:
+                    self._translation_enabled = False
+                    print(f"[경고] 번역 모듈 로드 실패. 번역 기능이 비활성화됩니다: {e}")
+            return self.translator
     
     def _start_translation(self, track: TrackInfo):
         """번역 작업 시작"""
         self._stop_translation = False
+        req_id = self._req_id
         
         def translate_worker():
-            # 1. 번역 필요 여부 확인 (전체 가사 샘플링)
-            lyrics_texts = [line.text for line in self._current_lyrics if line.text]
-            if not self.translator.should_translate_lyrics(lyrics_texts):
+            if not self._ensure_translator():
+                return
+            
+            # 번역할 줄 (텍스트가 있고 아직 번역되지 않은 줄) - 한 번만 계산
+            lyrics = self._current_lyrics
+            pending_indices = [i for i, line in enumerate(lyrics) if line.text and not line.translation]
+            if not pending_indices:
+                return
+            pending_texts = [lyrics[i].text for i in pending_indices]
+            
+            # 1. 번역 필요 여부 확인 (가사 샘플링, 같은 가사면 이전 감지 결과 재사용)
+            lyrics_key = tuple(line.text for line in lyrics)
+            verdict = self._translation_verdict
+            if verdict is not None and verdict[0] == lyrics_key:
+                needs_translation = verdict[1]
+            else:
+                needs_translation = self.translator.should_translate_lyrics(pending_texts)
+                self._translation_verdict = (lyrics_key, needs_translation)
+            
+            if not needs_translation:
                 print("[번역] 번역 불필요 (언어 감지 결과)")
                 return
+            if req_id != self._req_id:
+                return
             
             print("[번역] 일괄 번역 작업 시작...")
             
-            # 2. 일괄 번역 (10줄씩)
-            texts_to_translate = [line.text for line in self._current_lyrics]
+            # 2. 일괄 번역 (10줄씩, 여러 배치를 동시에 요청)
             batch_size = 10
             
-            for batch_start in range(0, len(texts_to_translate), batch_size):
-                if self._stop_translation or self._current_track != track:
-                    print("[번역] 작업 중단됨")
-                    break
-                
-                batch_end = min(batch_start + batch_size, len(texts_to_translate))
-                batch_texts = texts_to_translate[batch_start:batch_end]
-                
-                try:
-                    # 일괄 번역 호출
-                    results = self.translator.translate_batch(batch_texts, batch_size=batch_size)
-                    
-                    # 결과 적용
-                    for i, result in enumerate(results):
-                        if result:
-                            line_idx = batch_start + i
-                            if line_idx < len(self._current_lyrics):
-                                self._current_lyrics[line_idx].translation = result.translation
-                                self._current_lyrics[line_idx].romanization = result.romanization
+            futures = {
+                self._translation_executor.submit(
+                    self.translator.translate_batch, pending_texts[batch_start:batch_start + batch_size], batch_size
+                ): batch_start
+                for batch_start in range(0, len(pending_texts), batch_size)
+            }
+            
+            try:
+                # 먼저 끝난 배치부터 적용
+                for future in as_completed(futures):
+                    if (self._stop_translation or req_id != self._req_id
+                            or self._current_track != track or self._current_lyrics is not lyrics):
+                        print("[번역] 작업 중단됨")
+                        break
                     
-                    # 배치마다 UI 업데이트
-                    if self.overlay.is_alive():
-                        self.overlay.schedule(0, self._display_lyrics)
+                    batch_start = futures[future]
+                    try:
+                        results = future.result()
                         
-                except Exception as e:
-                    print(f"[번역] 배치 처리 오류: {e}")
+                        # 결과 적용
+                        translated = []
+                        for i, result in enumerate(results):
+                            if result:
+                                line_index = pending_indices[batch_start + i]
+                                line = lyrics[line_index]
+                                line.translation = result.translation
+                                line.romanization = result.romanization
+                                translated.append(line_index)
+                        
+                        # 번역된 줄만 다시 그리기 예약 (연속된 배치는 한 번에 반영)
+                        if translated:
+                            with self._translated_lines_lock:
+                                self._translated_lines.update(translated)
+                            self._schedule_translation_refresh()
+                            
+                    except Exception as e:
+                        print(f"[번역] 배치 처리 오류: {e}")
+            finally:
+                # 중단된 경우 아직 시작하지 않은 배치 취소
+                for future in futures:
+                    future.cancel()
             
             print("[번역] 작업 완료")
             
-        self._translation_thread = threading.Thread(target=translate_worker, daemon=True)
-        self._translation_thread.start()
+        self._translation_future = self.executor.submit(translate_worker)
+    
+    def _cancel_translation(self):
+        """진행 중인 번역 중단 (아직 시작하지 않았으면 취소)"""
+        self._stop_translation = True
+        if self._translation_future is not None:
+            self._translation_future.cancel()
+    
+    def _schedule_translation_refresh(self):
+        """번역 결과 화면 반영 예약 (이미 예약되어 있으면 그 때 함께 반영)"""
+        if self._refresh_scheduled or not self.overlay.is_alive():
+            return
+        self._refresh_scheduled = True
+        self.overlay.schedule(self.TRANSLATION_REFRESH_MS, self._flush_translation_refresh)
+    
+    def _flush_translation_refresh(self):
+        """예약된 번역 결과 반영 (UI 스레드)"""
+        self._refresh_scheduled = False
+        if self._display_dirty:
+            self._display_lyrics()
+            return
+        
+        # 사용자가 스크롤 중이면 줄이 늘어나 위치가 밀리지 않도록 나중에 반영
+        if self.overlay.is_user_scrolling():
+            self._schedule_translation_refresh()
+            return
+        
+        with self._translated_lines_lock:
+            line_indices, self._translated_lines = self._translated_lines, set()
+        
+        # 표시 중인 가사의 해당 줄만 발음/번역 갱신
+        lyrics = self._current_lyrics
+        if self._display_source is not lyrics:
+            return
+        display_lines = self._display_lines
+        for i in sorted(line_indices):
+            if i >= len(display_lines):
+                continue
+            line = lyrics[i]
+            display_line = display_lines[i]
+            display_line.translation = line.translation
+            display_line.romanization = line.romanization
+            if not self.overlay.update_line_extras(i, line.romanization, line.translation):
+                # 표시 중인 위젯이 없으면 전체 다시 그리기
+                self._display_dirty = True
+                self._display_lyrics()
+                return
     
     def _adjust_sync(self, offset_ms: int):
         """싱크 조절 핸들러 (절대값)"""
@@ -470,14 +722,20 @@ class LyricsApp:
         # 즉시 반영
         self._sync_lyrics()
 
-    def _sync_lyrics(self):
-        """현재 재생 시간에 맞춰 가사 동기화"""
-        if not self._current_lyrics:
-            return
+    def _sync_lyrics(self) -> Optional[int]:
+        """
+        현재 재생 시간에 맞춰 가사 동기화
+        
+        Returns:
+            다음 줄 시작까지 남은 시간 (ms), 알 수 없으면 None
+        """
+        lyrics = self._current_lyrics
+        if not lyrics:
+            return None
         
         position_ms = get_playback_position_ms()
         if position_ms is None:
-            return
+            return None
             
         # 오프셋 적용: 현재 재생 시간에서 오프셋을 뺌
         # 예: 오프셋 +500ms (가사 지연) -> 현재 시간 10초일 때 9.5초의 가사를 보여줌
@@ -492,51 +750,90 @@ class LyricsApp:
         # 오프셋이 양수(+)면 "가사를 늦게(Delay)" -> 현재 시간이 덜 된 것처럼 행동.
         effective_position = position_ms - self._sync_offset
         
-        new_index = self._find_current_line(effective_position)
+        timeline_ms = self._get_timeline(lyrics)
+        position = bisect.bisect_right(timeline_ms, effective_position)
+        new_index = self._timeline_index[position - 1] if position else -1
         
         if new_index != self._current_line_index:
             self._current_line_index = new_index
             self._display_lyrics()
+        
+        # 다음 줄 시작까지 남은 시간 (타임스탬프 없는 줄은 이미 목록에서 빠져 있음)
+        if position < len(timeline_ms):
+            return timeline_ms[position] - effective_position
+        return None
     
-    def _find_current_line(self, current_time_ms: int) -> int:
-        """현재 시간에 해당하는 가사 라인 인덱스 찾기"""
-        current_idx = -1
-        for i, line in enumerate(self._current_lyrics):
-            if line.timestamp_ms is not None and line.timestamp_ms <= current_time_ms:
-                current_idx = i
-            elif line.timestamp_ms is not None and line.timestamp_ms > current_time_ms:
-                break
-        return current_idx
+    def _get_timeline(self, lyrics: list[LyricLine]) -> list[int]:
+        """타임스탬프 있는 줄의 시간 목록 반환 (가사 리스트가 바뀐 경우에만 다시 만듦)"""
+        if lyrics is not self._timeline_source:
+            timed = [(line.timestamp_ms, i) for i, line in enumerate(lyrics) if line.timestamp_ms is not None]
+            self._timeline_ms = [timestamp_ms for timestamp_ms, _ in timed]
+            self._timeline_index = [i for _, i in timed]
+            self._timeline_source = lyrics
+        return self._timeline_ms
     
     def _display_lyrics(self):
         """가사 표시 (번역 포함)"""
         if not self._current_lyrics:
+            self._display_source = None
             self.overlay.show_not_found()
             return
         
-        display_lines = []
-        for i, line in enumerate(self._current_lyrics):
-            is_current = (i == self._current_line_index) if self._current_line_index >= 0 else (i == 0)
-            
-            display_lines.append(LyricDisplayLine(
+        lyrics = self._current_lyrics
+        current = self._current_line_index if self._current_line_index >= 0 else 0
+        
+        # 같은 가사에서 현재 줄만 바뀐 경우: 이전/새 줄만 갱신
+        # 사용자가 스크롤 중이면 전체 재구성(설정 변경 등)은 미루고 하이라이트만 이동
+        dirty = self._display_dirty
+        if self._display_source is lyrics and (not dirty or self.overlay.is_user_scrolling()):
+            display_lines = self._display_lines
+            prev = display_lines[self._display_current]
+            prev.is_current = False
+            prev.color = self.DEFAULT_COLOR
+            self._display_current = current
+            line = display_lines[current]
+            line.is_current = True
+            line.color = self.HIGHLIGHT_COLOR
+            if self.overlay.set_current_line(current):
+                if dirty:
+                    self._schedule_translation_refresh()
+                return
+        
+        self._display_lines = [
+            LyricDisplayLine(
                 text=line.text,
-                color=self.HIGHLIGHT_COLOR if is_current else self.DEFAULT_COLOR,
-                is_current=is_current,
+                color=self.HIGHLIGHT_COLOR if i == current else self.DEFAULT_COLOR,
+                is_current=i == current,
                 translation=line.translation,
                 romanization=line.romanization
-            ))
-        
-        self.overlay.update_lyrics(display_lines)
+            )
+            for i, line in enumerate(lyrics)
+        ]
+        self._display_source = lyrics
+        self._display_current = current
+        self._display_dirty = False
+        
+        self.overlay.update_lyrics(self._display_lines)
     
     def _on_close(self):
         """종료 처리"""
         self._running = False
         self._stop_translation = True
         
+        # 대기 중인 가사 검색/번역 배치 취소 (종료 시 남은 요청을 기다리지 않도록)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self._translation_executor.shutdown(wait=False, cancel_futures=True)
+        self._translation_restart_executor.shutdown(wait=False, cancel_futures=True)
+        
         # 트레이 아이콘 정리
         if self.tray:
             self.tray.stop()
         
+        # 대기 중인 가사/번역 캐시 기록 (os._exit 경로에서는 atexit이 실행되지 않음)
+        self.lyrics_fetcher.close()
+        if self.translator is not None:
+            self.translator.close()
+        
         print("애플리케이션 종료")
         
         # Python 프로세스 완전 종료 보장
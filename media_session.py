@@ -4,9 +4,11 @@ Windows Media Session API를 사용하여 현재 재생 중인 미디어 정보
 """
 
 import asyncio
+import re
+import threading
+import time
 from dataclasses import dataclass
 from typing import Optional
-from datetime import datetime, timezone
 
 # Windows SDK imports
 from winsdk.windows.media.control import (
@@ -15,21 +17,198 @@ from winsdk.windows.media.control import (
     GlobalSystemMediaTransportControlsSessionPlaybackStatus as PlaybackStatus,
 )
 
-# 이벤트 루프 캐시 (재사용을 위해)
-_cached_loop = None
+# 동기 호출 최대 대기 시간 (초)
+MEDIA_TIMEOUT = 2.0     # 곡 정보 (곡 감지 스레드)
 
-def _get_or_create_loop():
-    """이벤트 루프 가져오기 또는 생성 (재사용)"""
-    global _cached_loop
+# 재생 위치 추정 기준을 다시 읽는 최대 간격 (초)
+# 그 사이에는 마지막으로 읽은 위치에서 경과 시간만큼 더해 계산 (재생/탐색 이벤트가 오면 즉시 다시 읽음)
+POSITION_RESYNC_SEC = 5.0
+
+# YouTube Music 재생 앱으로 인정하는 브라우저 앱 ID (소문자, 'edge'가 'msedge'도 포함)
+BROWSER_APP_PATTERN = re.compile(r'chrome|firefox|edge')
+
+# 재생 위치 읽기 실패 로그 최소 간격 (초) - 자주 호출되므로 실패가 이어져도 로그는 가끔만 출력
+POSITION_WARN_INTERVAL_SEC = 10.0
+
+# 공용 이벤트 루프 (전용 스레드에서 계속 실행, 호출마다 루프를 만들지 않음)
+# 곡 감지 스레드와 UI 스레드가 동시에 호출해도 같은 루프에 코루틴을 제출하므로 안전
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# 미디어 세션 매니저 캐시 (싱글톤이므로 한 번만 요청)
+_manager: Optional[MediaManager] = None
+# 진행 중인 매니저 요청 (동시에 요청한 호출은 이 요청 하나를 함께 기다림, 공용 루프에서만 접근)
+_manager_request: Optional[asyncio.Future] = None
+
+# 현재 세션 캐시 (세션 변경 이벤트 및 곡 정보 조회 시 갱신)
+# 재생 위치 조회는 이 세션에서 동기로 바로 읽음 (비동기 왕복 없음)
+_session: Optional[MediaSession] = None
+_session_tokens: Optional[tuple[int, int, int]] = None  # 현재 세션 이벤트 구독 토큰 (미디어 속성, 재생 정보, 타임라인)
+_session_lock = threading.Lock()
+
+# 재생 위치 추정 기준 (위치 ms, 읽은 시각 monotonic, 재생 중 여부) - None이면 다음 조회 때 다시 읽음
+_position_anchor: Optional[tuple[int, float, bool]] = None
+_last_position_warning = 0.0  # 마지막 재생 위치 읽기 실패 로그 시각 (monotonic)
+
+# 곡 정보/재생 상태 변경 알림 (WinRT 이벤트 스레드에서 설정, 곡 감지 스레드가 대기)
+_media_changed = threading.Event()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """공용 이벤트 루프 반환 (최초 호출 시 전용 스레드에서 시작)"""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="media-session", daemon=True).start()
+        return _loop
+
+
+def _run_sync(coro, timeout: float):
+    """코루틴을 공용 이벤트 루프에서 실행하고 결과를 기다림 (시간 초과 시 취소 후 예외)"""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    try:
+        return future.result(timeout=timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+async def _get_manager() -> MediaManager:
+    """미디어 세션 매니저 반환 (최초 호출 시에만 요청하고 세션 변경 이벤트 구독)"""
+    global _manager_request
+    if _manager is None:
+        # 기다리던 호출이 시간 초과로 취소되어도 공유 요청은 계속 진행
+        await asyncio.shield(_start_manager_request())
+    return _manager
+
+
+def _start_manager_request() -> asyncio.Future:
+    """진행 중인 매니저 요청 반환 (없으면 새로 시작, 공용 루프에서만 호출)"""
+    global _manager_request
+    if _manager_request is None:
+        _manager_request = asyncio.ensure_future(_request_manager())
+        _manager_request.add_done_callback(_on_manager_request_done)
+    return _manager_request
+
+
+def _on_manager_request_done(request: asyncio.Future):
+    """매니저 요청 실패 로그 (기다리는 호출이 없어도 예외를 확인해 경고가 남지 않도록)"""
+    if not request.cancelled() and request.exception() is not None:
+        _warn_position_error(request.exception())
+
+
+def _request_manager_soon():
+    """매니저 요청을 공용 루프에 예약 (결과를 기다리지 않음, UI 스레드용)"""
+    def start():
+        if _manager is None:
+            _start_manager_request()
+    _get_loop().call_soon_threadsafe(start)
+
+
+async def _request_manager():
+    """매니저 요청 및 세션 변경 이벤트 구독 (실패하면 다음 호출 때 다시 요청)"""
+    global _manager, _manager_request
+    try:
+        manager = await MediaManager.request_async()
+        _set_session(manager.get_current_session())
+        manager.add_current_session_changed(_on_current_session_changed)
+        _manager = manager
+    finally:
+        _manager_request = None
+
+
+def _set_session(session: Optional[MediaSession], force: bool = False):
+    """현재 세션 교체 (이전 세션 이벤트 해제 후 새 세션의 변경 이벤트 구독)"""
+    global _session, _session_tokens, _position_anchor
+    with _session_lock:
+        old = _session
+        # 같은 앱의 세션이면 다시 구독하지 않음 (폴링마다 재구독 방지)
+        if not force:
+            if old is None and session is None:
+                return
+            if (old is not None and session is not None
+                    and old.source_app_user_model_id == session.source_app_user_model_id):
+                return
+        
+        if old is not None and _session_tokens is not None:
+            try:
+                old.remove_media_properties_changed(_session_tokens[0])
+                old.remove_playback_info_changed(_session_tokens[1])
+                old.remove_timeline_properties_changed(_session_tokens[2])
+            except Exception:
+                pass
+        
+        _session = session
+        _session_tokens = None
+        _position_anchor = None
+        if session is not None:
+            try:
+                _session_tokens = (
+                    session.add_media_properties_changed(_on_session_event),
+                    session.add_playback_info_changed(_on_session_event),
+                    session.add_timeline_properties_changed(_on_timeline_event),
+                )
+            except Exception as e:
+                print(f"[MediaSession] 이벤트 구독 실패: {e}")
+    
+    _media_changed.set()
+
+
+def _on_current_session_changed(sender, args):
+    """현재 세션 변경 이벤트 핸들러 (WinRT 스레드에서 호출)"""
     try:
-        if _cached_loop is None or _cached_loop.is_closed():
-            _cached_loop = asyncio.new_event_loop()
-        return _cached_loop
+        session = sender.get_current_session()
     except Exception:
-        return asyncio.new_event_loop()
+        session = None
+    _set_session(session, force=True)
+
+
+def _on_session_event(sender, args):
+    """곡 정보/재생 상태 변경 이벤트 핸들러 (WinRT 스레드에서 호출)"""
+    global _position_anchor
+    _position_anchor = None
+    _media_changed.set()
+
+
+def _on_timeline_event(sender, args):
+    """타임라인 변경 이벤트 핸들러 (탐색 등, 다음 위치 조회 때 다시 읽도록 표시)"""
+    global _position_anchor
+    anchor = _position_anchor
+    _position_anchor = None
+    # 재생 중에는 동기화 틱이 다음 조회 때 바로 반영하므로 깨우지 않음
+    # 일시정지 중(또는 상태를 모를 때)에는 틱이 멈춰 있으므로 탐색 위치를 반영하도록 알림
+    if anchor is None or not anchor[2]:
+        _media_changed.set()
+
+
+def wait_for_media_change(timeout: float) -> bool:
+    """곡 정보/재생 상태 변경 이벤트를 최대 timeout초 대기 (이벤트가 발생했으면 True)"""
+    changed = _media_changed.wait(timeout)
+    _media_changed.clear()
+    return changed
+
+
+def has_media_session() -> bool:
+    """변경 이벤트를 받을 수 있는 현재 세션이 있는지 확인"""
+    return _session is not None and _session_tokens is not None
 
 
-@dataclass
+def is_playing() -> Optional[bool]:
+    """현재 세션이 재생 중인지 확인 (세션이 없으면 None)"""
+    anchor = _position_anchor
+    if anchor is not None:
+        return anchor[2]
+    session = _session
+    if session is None:
+        return None
+    try:
+        return session.get_playback_info().playback_status == PlaybackStatus.PLAYING
+    except Exception:
+        return None
+
+
+@dataclass(slots=True)
 class MediaInfo:
     """미디어 정보"""
     title: str
@@ -41,37 +220,55 @@ class MediaInfo:
 
 
 def _calculate_correct_position(session) -> int:
-    """세션 정보를 바탕으로 현재 재생 위치 계산 (보정 포함)"""
+    """세션 정보를 바탕으로 현재 재생 위치 계산 (보정 포함, 읽기 실패 시 0)"""
+    result = _read_position(session)
+    return result[0] if result else 0
+
+
+def _warn_position_error(error: Exception):
+    """재생 위치 읽기 실패 로그 (POSITION_WARN_INTERVAL_SEC마다 한 번만)"""
+    global _last_position_warning
+    now = time.monotonic()
+    if now - _last_position_warning >= POSITION_WARN_INTERVAL_SEC:
+        _last_position_warning = now
+        print(f"[MediaSession] 재생 위치 읽기 실패: {error}")
+
+
+def _read_position(session) -> Optional[tuple[int, bool]]:
+    """세션에서 (보정된 현재 재생 위치, 재생 중 여부) 읽기 (WinRT 호출 실패 시 None)"""
     try:
         timeline = session.get_timeline_properties()
         playback_info = session.get_playback_info()
         
         position = int(timeline.position.total_seconds() * 1000)
+        playing = playback_info.playback_status == PlaybackStatus.PLAYING
         
         # 재생 중인 경우 LastUpdatedTime을 이용하여 보정
-        if playback_info.playback_status == PlaybackStatus.PLAYING:
+        if playing:
             last_updated = getattr(timeline, 'last_updated_time', None)
             if last_updated:
-                # winsdk의 datetime은 파이썬 datetime과 호환됨
-                now = datetime.now(timezone.utc)
-                diff = (now - last_updated).total_seconds()
+                # winsdk의 datetime은 파이썬 datetime과 호환됨 (현재 시각 datetime 생성 없이 초 단위로 비교)
+                diff = time.time() - last_updated.timestamp()
                 
                 if diff > 0:
                     position += int(diff * 1000)
         
-        return position
-    except Exception:
-        return 0
+        return position, playing
+    except Exception as e:
+        # 일시적인 실패를 위치 0으로 취급하면 가사가 처음으로 튀므로 '알 수 없음'으로 반환
+        _warn_position_error(e)
+        return None
 
 
 async def get_current_media_async() -> Optional[MediaInfo]:
     """비동기로 현재 재생 중인 미디어 정보 가져오기"""
     try:
-        # 미디어 세션 매니저 가져오기
-        manager = await MediaManager.request_async()
+        # 미디어 세션 매니저 가져오기 (캐시)
+        manager = await _get_manager()
         
-        # 현재 세션 가져오기
+        # 현재 세션 가져오기 (이벤트 누락 대비로 세션 캐시도 함께 갱신)
         session = manager.get_current_session()
+        _set_session(session)
         
         if session is None:
             return None
@@ -108,10 +305,7 @@ async def get_current_media_async() -> Optional[MediaInfo]:
 def get_current_media() -> Optional[MediaInfo]:
     """동기 함수로 현재 재생 중인 미디어 정보 가져오기"""
     try:
-        loop = _get_or_create_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(get_current_media_async())
-        return result
+        return _run_sync(get_current_media_async(), MEDIA_TIMEOUT)
     except Exception as e:
         print(f"[MediaSession] 동기 호출 오류: {e}")
         return None
@@ -119,34 +313,48 @@ def get_current_media() -> Optional[MediaInfo]:
 
 def get_playback_position_ms() -> Optional[int]:
     """현재 재생 위치만 빠르게 가져오기 (밀리초, 보정 포함)"""
+    global _position_anchor
     try:
-        loop = _get_or_create_loop()
-        asyncio.set_event_loop(loop)
+        # 최근에 읽은 기준이 있으면 경과 시간으로 추정 (WinRT 호출 없음)
+        now = time.monotonic()
+        anchor = _position_anchor
+        if anchor is not None and now - anchor[1] < POSITION_RESYNC_SEC:
+            position, sampled_at, playing = anchor
+            return position + int((now - sampled_at) * 1000) if playing else position
         
-        async def get_position():
-            manager = await MediaManager.request_async()
-            session = manager.get_current_session()
-            if session:
-                return _calculate_correct_position(session)
+        # 매니저가 아직 없으면 요청만 예약하고 '알 수 없음' 반환 (UI 스레드를 막지 않음)
+        if _manager is None:
+            _request_manager_soon()
             return None
         
-        result = loop.run_until_complete(get_position())
-        return result
+        # 캐시된 세션에서 동기로 읽고 추정 기준 갱신
+        session = _session
+        if session:
+            result = _read_position(session)
+            if result is None:
+                return None
+            position, playing = result
+            _position_anchor = (position, time.monotonic(), playing)
+            return position
+        return None
     except Exception as e:
-        # 디버그용 로깅은 생략 (빈번한 호출)
+        # WinRT 호출 실패 (세션 종료 등)
+        _warn_position_error(e)
         return None
 
 
 def is_youtube_music(media: MediaInfo) -> bool:
     """YouTube Music에서 재생 중인지 확인"""
-    source_lower = media.source_app.lower()
-    # 브라우저 앱 ID에서 확인
-    return any(browser in source_lower for browser in ['chrome', 'firefox', 'msedge', 'edge'])
+    # 브라우저 앱 ID에서 확인 (정규식 한 번으로 검사)
+    return BROWSER_APP_PATTERN.search(media.source_app.lower()) is not None
 
 
 class MediaSessionWatcher:
     """이벤트 기반 미디어 세션 감시 (곡 변경 즉시 감지)"""
     
+    # 곡 변경 시 세션/미디어 속성 이벤트가 연달아 오므로 이 시간 동안 모아서 한 번만 확인 (초)
+    CHECK_DEBOUNCE_SEC = 0.05
+    
     def __init__(self, on_track_changed: callable = None):
         """
         Args:
@@ -160,11 +368,16 @@ class MediaSessionWatcher:
         self._loop = None
         self._session_changed_token = None
         self._media_properties_token = None
+        # 이벤트 스레드에서 기록하고 루프에서 한 번에 처리 (이벤트마다 루프를 깨우지 않음)
+        self._event_lock = threading.Lock()
+        self._check_pending = False  # 확인이 예약되어 있는지 (그 사이 이벤트는 예약된 확인에 합쳐짐)
+        self._reconnect_pending = False  # 예약된 확인에서 세션 재연결도 필요한지
     
     async def _start_async(self):
         """비동기 감시 시작"""
         try:
-            self._manager = await MediaManager.request_async()
+            # 모듈 함수가 이미 받아 둔 매니저가 있으면 재사용 (싱글톤)
+            self._manager = _manager or await MediaManager.request_async()
             
             # 세션 변경 이벤트 구독
             self._session_changed_token = self._manager.add_current_session_changed(
@@ -182,9 +395,28 @@ class MediaSessionWatcher:
     def _on_session_changed(self, sender, args):
         """세션 변경 이벤트 핸들러"""
         print("[MediaWatcher] 세션 변경 감지")
-        # 비동기 작업은 이벤트 루프에서 실행
+        self._schedule_check(reconnect=True)
+    
+    def _schedule_check(self, reconnect: bool = False):
+        """확인 예약 (이벤트 스레드에서 호출, 비동기 작업은 이벤트 루프에서 실행)"""
         if self._loop and self._running:
-            asyncio.run_coroutine_threadsafe(self._connect_session(), self._loop)
+            with self._event_lock:
+                self._reconnect_pending = self._reconnect_pending or reconnect
+                if self._check_pending:
+                    return  # 이미 예약된 확인에 합쳐짐 (루프를 다시 깨우지 않음)
+                self._check_pending = True
+            self._loop.call_soon_threadsafe(self._arm_check)
+    
+    def _arm_check(self):
+        """첫 이벤트 후 CHECK_DEBOUNCE_SEC 뒤에 확인 (그 사이 연달아 온 이벤트는 한 번에 처리)"""
+        self._loop.call_later(self.CHECK_DEBOUNCE_SEC, self._run_check)
+    
+    def _run_check(self):
+        """예약된 확인 실행 (세션이 바뀌었으면 재연결, 재연결 시 미디어 확인도 함께 수행)"""
+        with self._event_lock:
+            reconnect, self._reconnect_pending = self._reconnect_pending, False
+            self._check_pending = False
+        self._loop.create_task(self._connect_session() if reconnect else self._check_media())
     
     async def _connect_session(self):
         """현재 세션에 연결하고 이벤트 구독"""
@@ -214,8 +446,7 @@ class MediaSessionWatcher:
     def _on_media_properties_changed(self, sender, args):
         """미디어 속성 변경 이벤트 핸들러 (곡 변경 등)"""
         print("[MediaWatcher] 미디어 속성 변경 감지")
-        if self._loop and self._running:
-            asyncio.run_coroutine_threadsafe(self._check_media(), self._loop)
+        self._schedule_check()
     
     async def _check_media(self):
         """현재 미디어 정보 확인 및 콜백 호출"""
@@ -260,20 +491,22 @@ class MediaSessionWatcher:
     
     def start(self):
         """감시 시작 (별도 스레드에서 이벤트 루프 실행)"""
-        import threading
+        # stop()이 바로 호출되어도 루프에 중지를 요청할 수 있도록 스레드 시작 전에 생성
+        self._loop = asyncio.new_event_loop()
+        self._running = True
         
         def run_loop():
-            self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
-            self._running = True
-            
-            self._loop.run_until_complete(self._start_async())
-            
-            # 이벤트 루프 유지
-            while self._running:
-                self._loop.run_until_complete(asyncio.sleep(0.1))
-            
-            self._loop.close()
+            try:
+                self._loop.run_until_complete(self._start_async())
+                
+                # 이벤트 루프 유지 (이벤트 핸들러가 _schedule_check에서 call_soon_threadsafe로 깨우므로 주기적으로 깨어날 필요 없음)
+                if self._running:
+                    self._loop.run_forever()
+            except RuntimeError:
+                pass  # 시작 중에 stop()이 호출된 경우
+            finally:
+                self._loop.close()
         
         self._thread = threading.Thread(target=run_loop, daemon=True)
         self._thread.start()
@@ -282,6 +515,9 @@ class MediaSessionWatcher:
     def stop(self):
         """감시 중지"""
         self._running = False
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
         print("[MediaWatcher] 워처 중지됨")
     
     def get_current_media(self) -> Optional[MediaInfo]:
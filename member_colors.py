@@ -8,6 +8,12 @@ import os
 from pathlib import Path
 from typing import Optional
 
+# 빠른 JSON 디코더 (선택적, 없으면 표준 json 사용 - 둘 다 bytes 입력을 받음)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 class MemberColors:
     """그룹별 멤버 색상 관리"""
@@ -49,7 +55,13 @@ class MemberColors:
         self.json_path = Path(json_path)
         self._data: dict[str, dict[str, str]] = {}
         self._member_to_group: dict[str, str] = {}  # 멤버 -> 그룹 역매핑
+        # 소문자 멤버 이름 -> 색상 조회 테이블 (get_color에서 매번 멤버 목록을 순회하지 않도록 미리 계산)
+        self._lower_color_by_group: dict[str, dict[str, str]] = {}  # 그룹 -> {소문자 멤버: 색상}
+        self._color_by_member: dict[str, str] = {}  # 소문자 멤버 -> 역매핑된 그룹에서의 색상
         self._unknown_member_colors: dict[str, str] = {}  # 동적 할당된 색상
+        self._color_cache: dict[tuple[str, Optional[str]], str] = {}  # (멤버, 그룹) -> get_color 결과 (데이터 변경 시 초기화)
+        self._lower_groups: list[tuple[str, str]] = []  # (소문자 그룹 이름, 그룹 이름) - 파일 순서 유지
+        self._group_by_artist: dict[str, Optional[str]] = {}  # 아티스트 -> find_group_by_artist 결과 (데이터 변경 시 초기화)
         self._fallback_index = 0
         
         self._load_data()
@@ -58,8 +70,7 @@ class MemberColors:
         """JSON 파일에서 색상 데이터 로드"""
         if self.json_path.exists():
             try:
-                with open(self.json_path, 'r', encoding='utf-8') as f:
-                    self._data = json.load(f)
+                self._data = json_loads(self.json_path.read_bytes())
                 
                 # 역매핑 생성 (대소문자 무시)
                 for group, members in self._data.items():
@@ -69,6 +80,27 @@ class MemberColors:
             except Exception as e:
                 print(f"색상 데이터 로드 오류: {e}")
                 self._data = {}
+        
+        self._build_lookup()
+    
+    def _build_lookup(self):
+        """소문자 멤버 이름 기준 색상 조회 테이블 생성 (데이터 변경 시 호출)"""
+        self._lower_color_by_group = {}
+        for group, members in self._data.items():
+            lower_colors = {}
+            for member, color in members.items():
+                # 대소문자만 다른 멤버가 여럿이면 먼저 나온 멤버 색상 사용
+                lower_colors.setdefault(member.lower(), color)
+            self._lower_color_by_group[group] = lower_colors
+        
+        self._color_cache.clear()
+        self._group_by_artist.clear()
+        self._lower_groups = [(group.lower(), group) for group in self._data]
+        self._color_by_member = {}
+        for member_lower, group in self._member_to_group.items():
+            color = self._lower_color_by_group.get(group, {}).get(member_lower)
+            if color is not None:
+                self._color_by_member[member_lower] = color
     
     def get_color(self, member_name: Optional[str], group_name: Optional[str] = None) -> str:
         """
@@ -84,21 +116,28 @@ class MemberColors:
         if not member_name:
             return self.DEFAULT_COLOR
         
-        member_lower = member_name.lower().strip()
+        # 한 곡 안에서 같은 멤버가 반복되므로 최종 결과를 캐시
+        key = (member_name, group_name)
+        color = self._color_cache.get(key)
+        if color is None:
+            color = self._color_cache[key] = self._resolve_color(member_name.lower().strip(), group_name)
+        return color
+    
+    def _resolve_color(self, member_lower: str, group_name: Optional[str]) -> str:
+        """소문자 멤버 이름의 색상 조회 (없으면 자동 색상 할당)"""
         
         # 그룹이 지정된 경우
         if group_name:
-            group_data = self._data.get(group_name, {})
-            for member, color in group_data.items():
-                if member.lower() == member_lower:
+            group_colors = self._lower_color_by_group.get(group_name)
+            if group_colors is not None:
+                color = group_colors.get(member_lower)
+                if color is not None:
                     return color
         
         # 그룹 없이 멤버 이름만으로 검색
-        if member_lower in self._member_to_group:
-            group = self._member_to_group[member_lower]
-            for member, color in self._data.get(group, {}).items():
-                if member.lower() == member_lower:
-                    return color
+        color = self._color_by_member.get(member_lower)
+        if color is not None:
+            return color
         
         # 알 수 없는 멤버는 자동 색상 할당
         if member_lower not in self._unknown_member_colors:
@@ -120,14 +159,14 @@ class MemberColors:
         return members
     
     def find_group_by_artist(self, artist: str) -> Optional[str]:
-        """아티스트 문자열에서 그룹 이름 찾기"""
-        artist_lower = artist.lower()
+        """아티스트 문자열에서 그룹 이름 찾기 (곡마다 같은 아티스트가 반복되므로 결과 캐시)"""
+        if artist in self._group_by_artist:
+            return self._group_by_artist[artist]
         
-        for group in self._data:
-            if group.lower() in artist_lower:
-                return group
-        
-        return None
+        artist_lower = artist.lower()
+        found = next((group for group_lower, group in self._lower_groups if group_lower in artist_lower), None)
+        self._group_by_artist[artist] = found
+        return found
     
     def add_group(self, group_name: str, members: dict[str, str]):
         """
@@ -140,6 +179,7 @@ class MemberColors:
         self._data[group_name] = members
         for member in members:
             self._member_to_group[member.lower()] = group_name
+        self._build_lookup()
     
     def save(self):
         """현재 데이터를 JSON 파일에 저장"""
@@ -87,7 +87,7 @@ def adjust_color_brightness(hex_color, factor):
     except Exception:
         return hex_color
 
-@dataclass
+@dataclass(slots=True)
 class LyricDisplayLine:
     """화면에 표시할 가사 라인"""
     text: str
@@ -222,6 +222,8 @@ class RoundedSlider(tk.Canvas):
 class LyricsOverlay:
     """가사 오버레이 창"""
     
+    USER_SCROLL_HOLD_MS = 1500  # 마지막 휠 입력 후 자동 스크롤을 멈춰 두는 시간
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("YouTube Music Lyrics")
@@ -258,6 +260,19 @@ class LyricsOverlay:
         self._current_title = ""
         self._current_artist = ""
         
+        # 현재 표시 중인 가사 (하이라이트만 바뀔 때 위젯을 다시 만들지 않도록 보관)
+        self._line_map: dict[int, tk.Label] = {}
+        self._rom_label_map: dict[int, tk.Label] = {}    # 줄 인덱스 -> 발음 라벨
+        self._trans_label_map: dict[int, tk.Label] = {}  # 줄 인덱스 -> 번역 라벨
+        self._current_line = -1
+        self._normal_font: Optional[tkfont.Font] = None
+        self._highlight_font: Optional[tkfont.Font] = None
+        self._sub_font: Optional[tkfont.Font] = None
+        
+        # 사용자 스크롤 상태 (스크롤 중에는 현재 줄로 자동 스크롤하지 않음)
+        self._user_scrolling = False
+        self._user_scroll_after_id = None
+        
         # 최소화 상태
         self._is_minimized = False
         self._pre_minimize_geometry = None
@@ -987,6 +1002,21 @@ class LyricsOverlay:
     def _on_mousewheel(self, event):
         """마우스 휠 스크롤"""
         self.lyrics_container.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        
+        # 마지막 휠 입력 후 일정 시간 동안 사용자 스크롤 상태 유지
+        self._user_scrolling = True
+        if self._user_scroll_after_id is not None:
+            self.root.after_cancel(self._user_scroll_after_id)
+        self._user_scroll_after_id = self.root.after(self.USER_SCROLL_HOLD_MS, self._end_user_scroll)
+    
+    def _end_user_scroll(self):
+        """사용자 스크롤 상태 해제"""
+        self._user_scrolling = False
+        self._user_scroll_after_id = None
+    
+    def is_user_scrolling(self) -> bool:
+        """사용자가 가사를 스크롤하는 중인지 확인"""
+        return self._user_scrolling
     
     def _handle_close(self):
         """닫기 처리"""
@@ -1486,8 +1516,11 @@ class LyricsOverlay:
     
     def update_lyrics(self, lines: list[LyricDisplayLine]):
         """가사 표시 업데이트"""
-        # 인덱스 매핑 (가사 라인 인덱스 -> 메인 라벨 위젯)
-        self._line_map: dict[int, tk.Label] = {}
+        # 인덱스 매핑 (가사 라인 인덱스 -> 메인/발음/번역 라벨 위젯)
+        self._line_map = {}
+        self._rom_label_map = {}
+        self._trans_label_map = {}
+        self._current_line = -1
         
         # 새 가사/메시지 로드 전 스크롤을 맨 위로 초기화
         # (이전 곡에서 스크롤이 내려가 있으면 새 내용이 보이지 않는 문제 방지)
@@ -1509,6 +1542,9 @@ class LyricsOverlay:
         normal_font = tkfont.Font(family=font_family, size=base_size)
         highlight_font = tkfont.Font(family=font_family, size=base_size + 2, weight="bold")
         sub_font = tkfont.Font(family=font_family, size=max(7, base_size - 2))  # 번역/발음용 작은 폰트
+        self._normal_font = normal_font
+        self._highlight_font = highlight_font
+        self._sub_font = sub_font
         
         current_y = 0
         
@@ -1559,48 +1595,95 @@ class LyricsOverlay:
             
             # 맵핑 저장
             self._line_map[i] = label
+            if line.is_current:
+                self._current_line = i
             
-            # 발음 표시 (있는 경우)
-            if line.romanization:
-                rom_label = tk.Label(
-                    self.lyrics_frame,
-                    text=f"    {line.romanization}",
-                    bg=bg_color,
-                    fg="#7a7a9a",  # 회색빛 보라
-                    font=sub_font,
-                    wraplength=360,
-                    justify=tk.LEFT,
-                    anchor="w",
-                    padx=10,
-                    pady=0
-                )
-                rom_label.pack(fill=tk.X, pady=0)
-                rom_label.bind("<MouseWheel>", self._on_mousewheel)
-                self._lyric_labels.append(rom_label)
-            
-            # 번역 표시 (있는 경우)
-            if line.translation:
-                trans_label = tk.Label(
-                    self.lyrics_frame,
-                    text=f"    {line.translation}",
-                    bg=bg_color,
-                    fg="#5a5a7a",  # 더 어두운 회색
-                    font=sub_font,
-                    wraplength=360,
-                    justify=tk.LEFT,
-                    anchor="w",
-                    padx=10,
-                    pady=2
-                )
-                trans_label.pack(fill=tk.X, pady=1)
-                trans_label.bind("<MouseWheel>", self._on_mousewheel)
-                self._lyric_labels.append(trans_label)
+            # 발음/번역 표시 (있는 경우)
+            self._set_line_extras(i, line.romanization, line.translation)
             
             # 현재 줄로 스크롤
             if line.is_current and i > 3:
                 # 약간의 지연 후 스크롤 (위젯 배치가 완료된 후)
                 self.root.after(100, lambda idx=i: self._scroll_to_line(idx))
     
+    def update_line_extras(self, line_index: int, romanization: str, translation: str) -> bool:
+        """
+        한 줄의 발음/번역 표시만 갱신 (전체 위젯을 다시 만들지 않음)
+        
+        Returns:
+            적용 여부 (표시 중인 가사 위젯이 없으면 False - 이때는 update_lyrics 필요)
+        """
+        label = self._line_map.get(line_index)
+        if label is None or not label.winfo_exists() or self._sub_font is None:
+            return False
+        self._set_line_extras(line_index, romanization, translation)
+        return True
+    
+    def _set_line_extras(self, line_index: int, romanization: str, translation: str):
+        """메인 라벨 아래의 발음/번역 라벨 생성/갱신/제거 (순서: 메인 -> 발음 -> 번역)"""
+        after = self._line_map[line_index]
+        after = self._set_sub_label(self._rom_label_map, line_index, romanization, after,
+                                    fg="#7a7a9a", pady=0, pack_pady=0)  # 회색빛 보라
+        self._set_sub_label(self._trans_label_map, line_index, translation, after,
+                            fg="#5a5a7a", pady=2, pack_pady=1)  # 더 어두운 회색
+    
+    def _set_sub_label(self, label_map: dict[int, tk.Label], line_index: int, text: str,
+                       after: tk.Label, fg: str, pady: int, pack_pady: int) -> tk.Label:
+        """보조 라벨 하나를 after 바로 아래에 배치하고, 다음 라벨의 기준이 될 위젯 반환"""
+        sub_label = label_map.get(line_index)
+        if not text:
+            if sub_label is not None:
+                sub_label.destroy()
+                del label_map[line_index]
+                self._lyric_labels.remove(sub_label)
+            return after
+        
+        if sub_label is not None:
+            sub_label.configure(text=f"    {text}")
+            return sub_label
+        
+        sub_label = tk.Label(
+            self.lyrics_frame,
+            text=f"    {text}",
+            bg=self._bg_color,
+            fg=fg,
+            font=self._sub_font,
+            wraplength=360,
+            justify=tk.LEFT,
+            anchor="w",
+            padx=10,
+            pady=pady
+        )
+        sub_label.pack(fill=tk.X, pady=pack_pady, after=after)
+        sub_label.bind("<MouseWheel>", self._on_mousewheel)
+        self._lyric_labels.append(sub_label)
+        label_map[line_index] = sub_label
+        return sub_label
+    
+    def set_current_line(self, line_index: int) -> bool:
+        """
+        현재 줄 하이라이트만 이동 (위젯을 다시 만들지 않고 이전/새 줄 라벨 스타일만 변경)
+        
+        Returns:
+            적용 여부 (표시 중인 가사 위젯이 없으면 False - 이때는 update_lyrics 필요)
+        """
+        new_label = self._line_map.get(line_index)
+        if new_label is None or not new_label.winfo_exists():
+            return False
+        if line_index == self._current_line:
+            return True
+        
+        prev_label = self._line_map.get(self._current_line)
+        if prev_label is not None and prev_label.winfo_exists():
+            prev_label.configure(fg=self._text_color, font=self._normal_font)
+        new_label.configure(fg=self._highlight_color, font=self._highlight_font)
+        self._current_line = line_index
+        
+        # 현재 줄로 스크롤 (사용자가 스크롤 중이면 위치를 빼앗지 않음)
+        if line_index > 3 and not self._user_scrolling:
+            self.root.after(100, lambda idx=line_index: self._scroll_to_line(idx))
+        return True
+    
     def _scroll_to_line(self, line_index: int):
         """특정 라인으로 스크롤"""
         if line_index not in self._line_map:
@@ -1678,9 +1761,16 @@ class LyricsOverlay:
         """메인 루프 시작"""
         self.root.mainloop()
     
-    def schedule(self, delay_ms: int, callback: Callable):
-        """콜백 예약"""
-        self.root.after(delay_ms, callback)
+    def schedule(self, delay_ms: int, callback: Callable) -> str:
+        """콜백 예약 (취소용 ID 반환)"""
+        return self.root.after(delay_ms, callback)
+    
+    def cancel_schedule(self, after_id: str):
+        """예약한 콜백 취소 (이미 실행된 경우 무시)"""
+        try:
+            self.root.after_cancel(after_id)
+        except tk.TclError:
+            pass
     
     def is_alive(self) -> bool:
         """창이 살아있는지 확인"""
@@ -1,5 +1,6 @@
 import json
 import os
+import sys
 from typing import Callable, Any, Dict, List
 
 class SettingsManager:
@@ -18,7 +19,6 @@ class SettingsManager:
     
     def __init__(self, filepath="settings.json"):
         # PyInstaller 환경 지원
-        import sys
         if getattr(sys, 'frozen', False):
             # exe 실행 시
             base_path = os.path.dirname(sys.executable)
@@ -60,14 +60,20 @@ class SettingsManager:
         return self._settings.copy()
         
     def set(self, key: str, value: Any):
-        """설정값 변경 및 저장"""
+        """설정값 변경 및 저장 (값이 같으면 디스크에 쓰지 않음)"""
+        if key in self._settings and self._settings[key] == value:
+            return
         self._settings[key] = value
         self._save()
         self._notify_observers()
         
     def update(self, new_settings: Dict[str, Any]):
-        """여러 설정값 업데이트 및 저장"""
-        self._settings.update(new_settings)
+        """여러 설정값 업데이트 및 저장 (바뀐 값이 없으면 디스크에 쓰지 않음)"""
+        changed = {key: value for key, value in new_settings.items()
+                   if key not in self._settings or self._settings[key] != value}
+        if not changed:
+            return
+        self._settings.update(changed)
         self._save()
         self._notify_observers()
         
@@ -5,32 +5,25 @@
 """
 
 import re
+import time
 import win32gui
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Callable
 
 # Media Session 모듈 임포트
 try:
-    from media_session import get_current_media, is_youtube_music
+    from media_session import get_current_media, is_youtube_music, has_media_session, wait_for_media_change
     MEDIA_SESSION_AVAILABLE = True
 except ImportError:
     MEDIA_SESSION_AVAILABLE = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrackInfo:
-    """현재 재생 중인 곡 정보"""
+    """현재 재생 중인 곡 정보 (제목/아티스트로만 비교)"""
     title: str
     artist: str
-    duration_ms: int = 0  # 곡 길이 (밀리초)
-    
-    def __eq__(self, other):
-        if not isinstance(other, TrackInfo):
-            return False
-        return self.title == other.title and self.artist == other.artist
-    
-    def __hash__(self):
-        return hash((self.title, self.artist))
+    duration_ms: int = field(default=0, compare=False)  # 곡 길이 (밀리초)
 
 
 class TrackDetector:
@@ -53,7 +46,19 @@ class TrackDetector:
     
     @property
     def is_event_mode(self) -> bool:
-        """이벤트 모드 활성화 여부 (현재 비활성화)"""
+        """이벤트 모드 활성화 여부 (Media Session 변경 이벤트를 받고 있으면 True)"""
+        return self._use_media_session and has_media_session()
+    
+    def wait_for_change(self, timeout: float) -> bool:
+        """
+        곡/재생 상태 변경을 최대 timeout초 대기
+        
+        Returns:
+            변경 이벤트로 깨어났으면 True, 시간이 다 됐으면 False
+        """
+        if self._use_media_session:
+            return wait_for_media_change(timeout)
+        time.sleep(timeout)
         return False
     
     def get_current_track(self) -> Optional[TrackInfo]:
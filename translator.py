@@ -6,6 +6,8 @@
 
 import locale
 import re
+import sqlite3
+import threading
 from dataclasses import dataclass
 from typing import Optional
 from langdetect import detect, DetectorFactory
@@ -18,7 +20,7 @@ DetectorFactory.seed = 0
 
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslatedLine:
     """번역된 가사 라인"""
     original: str           # 원본 가사
@@ -30,6 +32,9 @@ class TranslatedLine:
 class LyricsTranslator:
     """가사 번역 및 발음 표기"""
     
+    CACHE_FILE = "translation_cache.db"  # 번역 결과 캐시 (다시 재생한 곡은 번역 요청 없이 표시)
+    CACHE_SIZE = 2000  # 메모리에 유지하는 번역 결과 수 (최근 사용 순, 나머지는 필요할 때 DB에서 조회)
+    
     # 로마자 발음이 필요한 언어들 (비라틴 문자)
     NEEDS_ROMANIZATION = {'ja', 'ko', 'zh-cn', 'zh-tw', 'ar', 'he', 'th', 'ru'}
     
@@ -45,7 +50,13 @@ class LyricsTranslator:
             target_lang: 번역 목표 언어. None이면 Windows 시스템 언어 사용
         """
         self.target_lang = target_lang or self._get_system_language()
-        self._cache: dict[str, TranslatedLine] = {}
+        self._cache: dict[str, TranslatedLine] = {}  # 캐시 키 -> 번역 결과 (최근 사용 순, 최대 CACHE_SIZE)
+        
+        # 디스크 캐시 (종료 시 새 번역만 모아서 기록)
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()  # 메모리 캐시, 대기 중인 기록, DB 접근 보호 (번역 스레드 여러 개에서 호출)
+        self._pending_writes: dict[str, TranslatedLine] = {}
+        self._load_cache()
         
         # PyKakasi 초기화 (일본어 -> 히라가나 변환용)
         self.kks = pykakasi.kakasi()
@@ -94,6 +105,84 @@ class LyricsTranslator:
         return 'ko'  # 기본값: 한국어
     
     
+    def _load_cache(self):
+        """디스크 캐시 열기 (전체를 메모리로 읽지 않고 필요한 줄만 _lookup에서 조회)"""
+        try:
+            self._db = sqlite3.connect(self.CACHE_FILE, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "target_lang TEXT NOT NULL, text TEXT NOT NULL, original TEXT, translation TEXT, "
+                "romanization TEXT, original_lang TEXT, PRIMARY KEY (target_lang, text))"
+            )
+            count = self._db.execute(
+                "SELECT COUNT(*) FROM translations WHERE target_lang = ?", (self.target_lang,)
+            ).fetchone()[0]
+            print(f"[번역] 캐시 연결 완료 ({count}줄)")
+        except Exception as e:
+            print(f"[번역] 캐시 로드 실패: {e}")
+            self._db = None
+    
+    def _lookup(self, cache_key: str) -> Optional[TranslatedLine]:
+        """캐시에서 번역 결과 조회 (메모리에 없으면 DB에서 읽어 메모리에 보관)"""
+        with self._db_lock:
+            result = self._cache.get(cache_key) or self._pending_writes.get(cache_key)
+            if result is None and self._db is not None:
+                try:
+                    # 빈 번역은 사용하지 않음 (이전 버전에서 저장된 실패 결과는 다시 번역)
+                    row = self._db.execute(
+                        "SELECT original, translation, romanization, original_lang FROM translations "
+                        "WHERE target_lang = ? AND text = ? AND translation != ''",
+                        (self.target_lang, cache_key)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"[번역] 캐시 조회 실패: {e}")
+                    row = None
+                if row:
+                    result = TranslatedLine(*row)
+            if result is not None:
+                self._cache_put(cache_key, result)
+            return result
+    
+    def _cache_put(self, cache_key: str, result: TranslatedLine):
+        """메모리 캐시에 최근 사용으로 저장 (가득 차면 가장 오래전에 사용한 항목 제거, _db_lock을 잡은 상태에서 호출)"""
+        self._cache.pop(cache_key, None)
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[cache_key] = result
+    
+    def _remember(self, cache_key: str, result: TranslatedLine):
+        """번역 결과를 캐시에 저장 (빈 번역은 다시 번역하도록 저장하지 않음, 디스크 기록은 save_cache에서 한 번에)"""
+        if not result.translation:
+            return
+        with self._db_lock:
+            self._cache_put(cache_key, result)
+            self._pending_writes[cache_key] = result
+    
+    def save_cache(self):
+        """새로 번역한 결과를 디스크 캐시에 기록"""
+        with self._db_lock:
+            if self._db is None or not self._pending_writes:
+                return
+            pending, self._pending_writes = self._pending_writes, {}
+            try:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                        [(self.target_lang, key, line.original, line.translation, line.romanization, line.original_lang)
+                         for key, line in pending.items()]
+                    )
+                print(f"[번역] 캐시 저장 완료 ({len(pending)}줄)")
+            except Exception as e:
+                print(f"[번역] 캐시 저장 실패: {e}")
+    
+    def close(self):
+        """대기 중인 캐시를 기록하고 DB 닫기 (종료 시 호출)"""
+        self.save_cache()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
     def _contains_japanese(self, text: str) -> bool:
         """일본어 문자(히라가나, 카타카나) 포함 여부 확인"""
         # 히라가나: 3040-309F
@@ -171,6 +260,9 @@ class LyricsTranslator:
         
         # 번역이 필요한 텍스트만 필터링
         to_translate = []  # (원본 인덱스, 정제된 텍스트)
+        queued = set()     # 이번에 번역할 캐시 키 (후렴 등 같은 줄은 한 번만 번역)
+        duplicates = []    # (원본 인덱스, 캐시 키) - 번역 후 이번 결과에서 채움
+        translated = {}    # 캐시 키 -> 이번에 번역한 결과 (캐시에 저장하지 않은 결과 포함)
         
         for i, text in enumerate(texts):
             if not text:
@@ -186,10 +278,15 @@ class LyricsTranslator:
             
             # 캐시 확인
             cache_key = clean_text.lower()
-            if cache_key in self._cache:
-                results[i] = self._cache[cache_key]
+            if cache_key in queued:
+                duplicates.append((i, cache_key))
+                continue
+            cached = self._lookup(cache_key)
+            if cached is not None:
+                results[i] = cached
                 continue
             
+            queued.add(cache_key)
             to_translate.append((i, clean_text))
         
         if not to_translate:
@@ -236,6 +333,8 @@ class LyricsTranslator:
                 
                 # 결과 분리
                 translated_parts = translated_combined.split(SEPARATOR) if translated_combined else []
+                # 구분자가 번역되어 줄 수가 어긋나면 줄별 매핑을 믿을 수 없으므로 이번 배치는 캐시에 저장하지 않음
+                aligned = len(translated_parts) == len(batch)
                 
                 # 결과 매핑
                 for j, (orig_idx, orig_text) in enumerate(batch):
@@ -254,8 +353,9 @@ class LyricsTranslator:
                     )
                     
                     # 캐시 저장
-                    cache_key = orig_text.lower()
-                    self._cache[cache_key] = result
+                    if aligned:
+                        self._remember(orig_text.lower(), result)
+                    translated[orig_text.lower()] = result
                     results[orig_idx] = result
                     
             except Exception as e:
@@ -264,8 +364,13 @@ class LyricsTranslator:
                 for orig_idx, orig_text in batch:
                     result = self.translate_line(orig_text)
                     if result:
+                        translated[orig_text.lower()] = result
                         results[orig_idx] = result
         
+        # 같은 줄이 반복된 경우 번역 결과 공유
+        for orig_idx, cache_key in duplicates:
+            results[orig_idx] = translated.get(cache_key)
+        
         return results
     
     def translate_line(self, text: str) -> Optional[TranslatedLine]:
@@ -289,8 +394,9 @@ class LyricsTranslator:
         
         # 캐시 확인
         cache_key = clean_text.lower()
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._lookup(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # 1. 일본어 강제 감지 (언어 감지 라이브러리보다 우선)
@@ -340,7 +446,7 @@ class LyricsTranslator:
                 original_lang=source_lang
             )
             
-            self._cache[cache_key] = translated
+            self._remember(cache_key, translated)
             return translated
             
         except Exception as e: